@@ -59,6 +59,9 @@ class RealTimePlotApplet(QtWidgets.QWidget, JaxApplet):
     def _initialize_gui(self, xlabel, ylabel):
         layout = QtWidgets.QGridLayout(self)
         self.plot_widget = _pg.PlotWidget()
+        # only draws visible data, reduced to about one min/max pair per pixel.
+        self.plot_widget.plotItem.setDownsampling(auto=True, mode="peak")
+        self.plot_widget.plotItem.setClipToView(True)
         self._set_axes_style(xlabel, ylabel)
         layout.addWidget(self.plot_widget, 0, 0)
         self.coords = QtWidgets.QLabel("")
@@ -113,11 +113,14 @@ class JaxEnvironment(HasEnvironment):
         if self._is_dataset_open:
             return
         rid, pipeline_name, priority, expid = self._get_experiment_info()
-        self.dv.open(expid["class_name"], True, rid)
-        self.dv.add_attribute("rid", rid, "scheduler")
-        self.dv.add_attribute("expid", self.serialize(expid), "scheduler")
-        self.dv.add_attribute("pipeline_name", pipeline_name, "scheduler")
-        self.dv.add_attribute("priority", priority, "scheduler")
+        # Settings in a packet are run in order by the server in a single request.
+        packet = self.dv.packet()
+        packet.open(expid["class_name"], True, rid)
+        packet.add_attribute("rid", rid, "scheduler")
+        packet.add_attribute("expid", self.serialize(expid), "scheduler")
+        packet.add_attribute("pipeline_name", pipeline_name, "scheduler")
+        packet.add_attribute("priority", priority, "scheduler")
+        packet.send()
         self._is_dataset_open = True
 
     @rpc
@@ -144,6 +147,21 @@ class JaxEnvironment(HasEnvironment):
             self.open_file()
         return self.dv.add_attribute(name, value, group_path)
 
+    @host_only
+    def add_attributes(self, attributes, group_path="/"):
+        """Adds multiple attributes in a single request to the vault server.
+
+        Args:
+            attributes: dict, {name: value} of the attributes.
+            group_path: str, path to the group to save the attributes at. Default "/", file root.
+        """
+        if not self._is_dataset_open:
+            self.open_file()
+        packet = self.dv.packet()
+        for name, value in attributes.items():
+            packet.add_attribute(name, value, group_path)
+        packet.send()
+
     @rpc
     def add_dataset(self, name, value, group_path="/datasets", shared=False) -> TStr:
         """Adds a dataset.
@@ -270,10 +288,11 @@ class JaxEnvironment(HasEnvironment):
             experiment_parameters: list of tuples, parameter needed for the experiment.
             pulse_sequence_classes: list of classes, pulse sequences classes needed.
         """
-        self.parameter_paths = experiment_parameters
+        # Copies experiment_parameters so the argument (or the default value) is not modified.
+        parameter_paths = dict.fromkeys(experiment_parameters)
         for pulse_sequence_class in pulse_sequence_classes:
-            self.parameter_paths.extend(pulse_sequence_class.all_required_parameters())
-        self.parameter_paths = list(set(self.parameter_paths))
+            parameter_paths.update(dict.fromkeys(pulse_sequence_class.all_required_parameters()))
+        self.parameter_paths = list(parameter_paths)
 
     @host_only
     def serialize(self, object):
@@ -316,8 +335,10 @@ class JaxEnvironment(HasEnvironment):
                 value_full = params_full[collection][name]
             params_full[collection][name] = remove_labrad_units(value_full)
         self.p = ParameterGroup(params)
-        self.add_attribute("parameters", self.serialize(params))
-        self.add_attribute("parameters_full", self.serialize(params_full))
+        self.add_attributes({
+            "parameters": self.serialize(params),
+            "parameters_full": self.serialize(params_full)
+        })
 
     @host_only
     def get_drift_tracker(self, name):
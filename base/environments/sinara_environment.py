@@ -38,6 +38,9 @@ class SinaraEnvironment(JaxEnvironment):
         super().prepare()
         self.rtio_cycle_mu = _np.int64(self.core.ref_multiplier)
         self.dds_set_delay_mu = self.core.seconds_to_mu(200*us)
+        self.kernel_invariants = getattr(self, "kernel_invariants", set()) | {
+            "rtio_cycle_mu", "dds_set_delay_mu"
+        }
         self._preexp_dds_params = _p.loads(self.cxn.artiq.get_dds_parameters())
         self._preexp_ttl_params = _p.loads(self.cxn.artiq.get_ttl_parameters())
 
@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 
 import numpy as np
@@ -18,6 +19,129 @@ class DRGType(Enum):
     AMP = 2
 
 
+@functools.lru_cache(maxsize=64)
+def _drg_to_mu(sysclk, start, end, ramp_interval, drg_type, num_of_steps, step_gap, dwell_high):
+    """Converts DRG parameters to machine units.
+
+    The conversion only depends on the arguments, so it is cached. DRGs with the same parameters
+    (e.g. created in every prepare() of a scan) are converted only once.
+
+    Args:
+        sysclk: float, the system clock frequency of the DDS.
+        Other arguments are documented in DRG.
+
+    Returns:
+        (rate, low, high, step). rate is an int. low, high, and step are np.int32.
+
+    Raises:
+        ValueError: Invalid DRG parameters.
+    """
+    rate = int(ramp_interval * sysclk / 4.0)
+    step = None
+
+    # DRG can only start from `low` + `step`.
+    # Store everything as uint32 for easier math and verifications.
+    if drg_type == DRGType.FREQ:
+        # Same as AD9910.frequency_to_ftw().
+        ftw_per_hz = (1 << 32) / sysclk
+
+        def _frequency_to_drg_args(frequency):
+            return np.int32(round(ftw_per_hz * frequency)).astype('uint32')
+
+        start_mu = _frequency_to_drg_args(start)
+        high = _frequency_to_drg_args(end)
+
+        if step_gap is not None:
+            if step_gap == "fine":
+                # Both DRG accuumlator and FTW have 32-bits resolution.
+                # DDS core fully reflects the DRG resolution.
+                step = np.uint32(1)
+            else:
+                step = _frequency_to_drg_args(step_gap)
+
+    elif drg_type == DRGType.PHASE:
+        # DRG registers are 32-bits. POW register is 16-bits.
+        # Using turns_to_pow will result in the loss of precision in DRG step.
+        def _turns_to_drg_args(turns):
+            pow_ = round(turns * (2**32))
+            if pow_ < 0 or pow_ > (2**32 - 1):
+                raise ValueError("Phase parameter does not wrap around in DRG")
+            return np.uint32(pow_)
+
+        start_mu = _turns_to_drg_args(start)
+        high = _turns_to_drg_args(end)
+
+        if step_gap is not None:
+            if step_gap == "fine":
+                # DRG has 32-bits resolution, but POW only has 16.
+                # Only the most-significant 16-bits can reach the DDS core.
+                step = np.uint32(1 << 16)
+            else:
+                step = _turns_to_drg_args(step_gap).astype('uint32')
+
+    elif drg_type == DRGType.AMP:
+        # DRG registers are 32-bits. ASF field in the ASF register is 14-bits.
+        # Using amplitude_to_asf will result in the loss of precision in DRG step.
+        def _amplitude_to_drg_regs(amplitude):
+            # Note the difference between amplitude and phase conversion.
+            # Amplitude scale factor does not overflow at 1.0; Phase offset does.
+            if amplitude < 0.0 or amplitude > 1.0:
+                raise ValueError("Amplitude parameter exceeds DRG limits")
+            return np.uint32(amplitude * 0xFFFFFFFF)
+
+        start_mu = _amplitude_to_drg_regs(start)
+        high = _amplitude_to_drg_regs(end)
+
+        if step_gap is not None:
+            if step_gap == "fine":
+                # DRG has 32-bits resolution, but ASF only has 14.
+                # Only the most-significant 18-bits can reach the DDS core.
+                step = np.uint32(1 << 18)
+            else:
+                step = _amplitude_to_drg_regs(step_gap).astype('uint32')
+
+    else:
+        raise ValueError("Invalid DRG type argument")
+
+    return (rate,) + _drg_limits(start_mu, high, step, num_of_steps, dwell_high)
+
+
+def _drg_limits(start_mu, high, step, num_of_steps, dwell_high):
+    """Calculates and verifies the DRG limits and step in machine units.
+
+    Args:
+        start_mu: np.uint32, the starting value of the DRG.
+        high: np.uint32, the upper limit of the DRG.
+        step: np.uint32, the DRG step increment. Ignored if num_of_steps is specified.
+        num_of_steps: int, the number of steps in the DRG, or None.
+        dwell_high: bool, see DRG.
+
+    Returns:
+        (low, high, step) as np.int32.
+
+    Raises:
+        ValueError: Invalid DRG parameters.
+    """
+    if high <= start_mu:
+        raise ValueError("Upper limit of DRG must be higher than the lower limit of DRG")
+
+    if num_of_steps is not None:
+        step = (high - start_mu)//(num_of_steps - 1)
+
+    # Verify dwell high condition.
+    if dwell_high != ((high + step) < 2**32):
+        raise ValueError("Inconsistent DRG dwell high behavior\n"
+                         + "Hint: Try dwell_high={}".format(not dwell_high))
+    # Verify start param validity
+    if start_mu < step:
+        raise ValueError("start value too low")
+
+    low = start_mu - step
+
+    # Cast DRG parameters from uint32 to int32. ARTIQ API only accepts int32.
+    return low.astype('int32'), high.astype('int32'), step.astype('int32')
+
+
 class DRG:
     """Digital Ramp Generator (DRG).
 
@@ -90,88 +214,50 @@ class DRG:
         if (num_of_steps is not None) == (step_gap is not None):
             raise ValueError("num_of_step and step_gap are both specified or unspecified")
         self.dest = drg_type.value
-        self.rate = int(ramp_interval * dds.sysclk / 4.0)
-
-        # DRG can only start from `low` + `step`.
-        # Store everything as uint32 for easier math and verifications.
-        if drg_type == DRGType.FREQ:
-            start_mu = dds.frequency_to_ftw(start).astype('uint32')
-            self.high = dds.frequency_to_ftw(end).astype('uint32')
-
-            if step_gap is not None:
-                if step_gap == "fine":
-                    # Both DRG accuumlator and FTW have 32-bits resolution.
-                    # DDS core fully reflects the DRG resolution.
-                    self.step = np.uint32(1)
-                else:
-                    self.step = dds.frequency_to_ftw(step_gap).astype('uint32')
-
-        elif drg_type == DRGType.PHASE:
-            # DRG registers are 32-bits. POW register is 16-bits.
-            # Using turns_to_pow will result in the loss of precision in DRG step.
-            def _turns_to_drg_args(turns):
-                pow_ = round(turns * (2**32))
-                if pow_ < 0 or pow_ > (2**32 - 1):
-                    raise ValueError("Phase parameter does not wrap around in DRG")
-                return np.uint32(pow_)
-
-            start_mu = _turns_to_drg_args(start)
-            self.high = _turns_to_drg_args(end)
-
-            if step_gap is not None:
-                if step_gap == "fine":
-                    # DRG has 32-bits resolution, but POW only has 16.
-                    # Only the most-significant 16-bits can reach the DDS core.
-                    self.step = np.uint32(1 << 16)
-                else:
-                    self.step = _turns_to_drg_args(step_gap).astype('uint32')
-
-        elif drg_type == DRGType.AMP:
-            # DRG registers are 32-bits. ASF field in the ASF register is 14-bits.
-            # Using amplitude_to_asf will result in the loss of precision in DRG step.
-            def _amplitude_to_drg_regs(amplitude):
-                # Note the difference between amplitude and phase conversion.
-                # Amplitude scale factor does not overflow at 1.0; Phase offset does.
-                if amplitude < 0.0 or amplitude > 1.0:
-                    raise ValueError("Amplitude parameter exceeds DRG limits")
-                return np.uint32(amplitude * 0xFFFFFFFF)
-
-            start_mu = _amplitude_to_drg_regs(start)
-            self.high = _amplitude_to_drg_regs(end)
-
-            if step_gap is not None:
-                if step_gap == "fine":
-                    # DRG has 32-bits resolution, but ASF only has 14.
-                    # Only the most-significant 18-bits can reach the DDS core.
-                    self.step = np.uint32(1 << 18)
-                else:
-                    self.step = _amplitude_to_drg_regs(step_gap).astype('uint32')
-
-        else:
-            raise ValueError("Invalid DRG type argument")
-
-        if self.high <= start_mu:
-            raise ValueError("Upper limit of DRG must be higher than the lower limit of DRG")
-
-        if num_of_steps is not None:
-            self.step = (self.high - start_mu)//(num_of_steps - 1)
-
-        # Verify dwell high condition.
-        if dwell_high != ((self.high + self.step) < 2**32):
-            raise ValueError("Inconsistent DRG dwell high behavior\n"
-                             + "Hint: Try dwell_high={}".format(not dwell_high))
-        # Verify start param validity
-        if start_mu < self.step:
-            raise ValueError("start value too low")
-
-        self.low = start_mu - self.step
-
-        # Cast DRG parameters from uint32 to int32. ARTIQ API only accepts int32.
-        for arg in ["low", "high", "step"]:
-            setattr(self, arg, getattr(self, arg).astype('int32'))
-
+        self.rate, self.low, self.high, self.step = _drg_to_mu(
+            dds.sysclk, start, end, ramp_interval, drg_type, num_of_steps, step_gap, dwell_high)
         self.drg_type = drg_type
 
+    @classmethod
+    def from_mu(cls, start_mu, end_mu, rate, drg_type,
+                num_of_steps=None, step_mu=None, dwell_high=True):
+        """Creates a DRG from parameters in machine units.
+
+        The float to machine unit conversion is skipped. All DRG types use the full 32-bit DRG
+        registers, e.g. a half turn is 1 << 31 for a phase DRG.
+
+        Args:
+            start_mu: int, the starting value of the DRG register. See `start` in DRG.
+            end_mu: int, the final value of the DRG register. See `end` in DRG.
+            rate: int, the number of 4*T_sysclk intervals between each step of the DRG.
+            drg_type: DRGType, the type of DRG.
+            num_of_steps: int, the number of steps in the DRG if specified. Exactly ONE of
+                `num_of_steps` and `step_mu` should be specified. Defaults to None.
+            step_mu: int, the DRG step increment if specified. Defaults to None.
+            dwell_high: bool, see DRG. Defaults to True.
+
+        Returns:
+            DRG, the DRG configuration.
+
+        Raises:
+            ValueError: Invalid DRG parameters.
+        """
+        if (num_of_steps is not None) == (step_mu is not None):
+            raise ValueError("num_of_step and step_mu are both specified or unspecified")
+        for value in [start_mu, end_mu] + ([step_mu] if step_mu is not None else []):
+            if value < 0 or value > (2**32 - 1):
+                raise ValueError("DRG parameter exceeds 32 bits")
+        if step_mu is not None:
+            step_mu = np.uint32(step_mu)
+
+        drg = cls.__new__(cls)
+        drg.dest = drg_type.value
+        drg.rate = rate
+        drg.low, drg.high, drg.step = _drg_limits(
+            np.uint32(start_mu), np.uint32(end_mu), step_mu, num_of_steps, dwell_high)
+        drg.drg_type = drg_type
+        return drg
+
 
 class DRGMap:
     """A mapping between DRG configuration and the DDS that performs the playback.
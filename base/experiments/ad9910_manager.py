@@ -43,9 +43,13 @@ class AD9910Manager:
             if ram_profile is not None:
                 self.ram_destination = ram_profile.dest
                 self.ram_enable = 1
+                # set_mu() only writes the registers not fed by the RAM.
+                self.set_mu_ram_destination = ram_profile.dest
             else:
                 self.ram_destination = 0
                 self.ram_enable = 0
+                # set_mu() writes the single-tone profile in a single 64-bit SPI transaction.
+                self.set_mu_ram_destination = -1
 
             if drg is not None:
                 self.drg_destination = drg.dest
@@ -65,6 +69,20 @@ class AD9910Manager:
             elif (drg is not None) and drg.drg_type == DRGType.AMP:
                 self.osk_enable = 0
 
+            # Relevant AD9910 CFR2 register flags.
+            ENABLE_SINGLE_TONE_ASF = 24
+            DRG_DEST = 20
+            DRG_ENABLE = 19
+            READ_EFFECTIVE_FTW = 16
+            MATCHED_LATENCY_ENABLE = 7
+
+            # CFR2 value written by enable(), so it is not recomputed in the kernel.
+            self.cfr2 = ((1 << ENABLE_SINGLE_TONE_ASF)
+                         | (self.drg_destination << DRG_DEST)
+                         | (self.drg_enable << DRG_ENABLE)
+                         | (1 << READ_EFFECTIVE_FTW)
+                         | (1 << MATCHED_LATENCY_ENABLE))
+
     def append(self, dds, frequency_src=0.0, phase_src=0.0, amplitude_src=1.0):
         """Append a AD9910 profile.
 
@@ -182,12 +200,10 @@ class AD9910Manager:
         self._load_drg_fp()
 
         # Configure as RAM profile if and only if a RAMProfile was submitted.
+        # The profile argument is ignored by set_mu() if a RAM destination is specified.
         for dds, cfg in self._cfg_map:
-            if not cfg.ram_enable:
-                dds.set_mu(ftw=cfg.ftw, pow_=cfg.pow_, asf=cfg.asf, profile=0)
-            else:
-                dds.set_mu(ftw=cfg.ftw, pow_=cfg.pow_, asf=cfg.asf,
-                           ram_destination=cfg.ram_destination)
+            dds.set_mu(ftw=cfg.ftw, pow_=cfg.pow_, asf=cfg.asf, profile=0,
+                       ram_destination=cfg.set_mu_ram_destination)
 
     @kernel
     def enable(self):
@@ -196,13 +212,6 @@ class AD9910Manager:
         After the function is called. Both RAM mode and the DRG are NOT active. Commit profile
         enable by calling commit_enable() after.
         """
-        # Relevant AD9910 CFR2 register flags.
-        ENABLE_SINGLE_TONE_ASF = 24
-        DRG_DEST = 20
-        DRG_ENABLE = 19
-        READ_EFFECTIVE_FTW = 16
-        MATCHED_LATENCY_ENABLE = 7
-
         for dds, cfg in self._cfg_map:
             dds.set_cfr1(ram_enable=cfg.ram_enable,
                          ram_destination=cfg.ram_destination,
@@ -210,12 +219,7 @@ class AD9910Manager:
                          drg_autoclear=cfg.drg_enable,
                          osk_enable=cfg.osk_enable)
             # Unfortunately ARTIQ does not expose everything on CFR2
-            dds.write32(ad9910._AD9910_REG_CFR2,
-                        (1 << ENABLE_SINGLE_TONE_ASF)
-                        | (cfg.drg_destination << DRG_DEST)
-                        | (cfg.drg_enable << DRG_ENABLE)
-                        | (1 << READ_EFFECTIVE_FTW)
-                        | (1 << MATCHED_LATENCY_ENABLE))
+            dds.write32(ad9910._AD9910_REG_CFR2, cfg.cfr2)
 
     @kernel
     def commit_enable(self):
@@ -6,6 +6,22 @@ from artiq.coredevice.ad9910 import (RAM_DEST_ASF, RAM_DEST_FTW, RAM_DEST_POW,
 from artiq.experiment import kernel
 
 
+def _turns_to_pow(turns):
+    """Vectorized AD9910.turns_to_pow()."""
+    turns = turns.astype(np.float64, copy=False)
+    return np.round(turns * 0x10000).astype(np.int64) & 0xffff
+
+
+def _amplitude_to_asf(amplitude):
+    """Vectorized AD9910.amplitude_to_asf()."""
+    # Scaled in float64 like the driver. float32 scaling rounds some ASFs differently.
+    amplitude = amplitude.astype(np.float64, copy=False)
+    asf = np.round(amplitude * 0x3fff).astype(np.int64)
+    if np.any((asf < 0) | (asf > 0x3fff)):
+        raise ValueError("Invalid AD9910 fractional amplitude!")
+    return asf
+
+
 class RAMType(Enum):
     """The type of data in the RAM.
 
@@ -65,12 +81,15 @@ class RAMProfile:
 
     Args:
         dds: AD9910, the DDS that will playback the RAM profile.
-        data: list of float/2-tuples (elaborated below), the data (amplitude,
-            phase, frequencies) to be put into the RAM.
+        data: list/np.ndarray of float/2-tuples (elaborated below), the data
+            (amplitude, phase, frequencies) to be put into the RAM.
             The type should be "list of float" for frequency/phase/amplitude
             RAM; and list of 2-tuples for polar RAM. The tuple consists of 2
             floats. The first represents phase, and the second represents
-            amplitude.
+            amplitude. A 1-D numpy array, or a (N, 2) numpy array for polar
+            RAM, is also accepted and encoded without conversion to lists.
+            float32 arrays are accepted, but all data are scaled in float64
+            to match the AD9910 driver conversions.
         ramp_interval: float, the time interval between each step of the RAM
             mode playback. Keep the interval at a multiple of 4*T_sysclk
             (4*1 ns).
@@ -118,32 +137,24 @@ class RAMProfile:
         if len(data) > RAMProfile.RAM_SIZE:
             raise ValueError("Data size exceeds the RAM capacity")
 
-        ram = np.zeros((len(data),), dtype=np.int32)
-        # Avoid contaminating the passed in data list
-        data = data.copy()
         # SPI transaction of AD9910 mandates the transmission of higher
         # order words before lower order words
-        # The data is reversed such that the first word shows up first
-        data.reverse()
+        # The data is reversed such that the first word shows up first.
+        # Slicing returns a reversed view, so the passed in data is neither
+        # copied nor modified.
+        data = np.asarray(data)[::-1]
 
-        # Encode the FTW, POW, ASF, and raw data en masse
         if ram_type == RAMType.FREQ:
             self.dest = RAM_DEST_FTW
-            dds.frequency_to_ram(data, ram)
         elif ram_type == RAMType.PHASE:
             self.dest = RAM_DEST_POW
-            dds.turns_to_ram(data, ram)
         elif ram_type == RAMType.AMP:
             self.dest = RAM_DEST_ASF
-            dds.amplitude_to_ram(data, ram)
         elif ram_type == RAMType.POLAR:
             self.dest = RAM_DEST_POWASF
-            # Unpack the list of tuples into tuples
-            # Zip it again to convert it into 2 lists
-            phase, amp = zip(*data)
-            dds.turns_amplitude_to_ram(phase, amp, ram)
         else:
             raise ValueError("Invalid RAM type")
+        ram = self._to_mu_array(dds, data, ram_type)
 
         self.start_addr = 0
         self.end_addr = len(ram) - 1    # Inclusive
@@ -157,6 +168,43 @@ class RAMProfile:
 
         self.nodwell_high = int(not dwell_end)
 
+    @staticmethod
+    def _to_mu_array(dds, data, ram_type):
+        """Encodes the FTW, POW, ASF, and raw data en masse.
+
+        The encoding is the same as AD9910.frequency_to_ram(), turns_to_ram(),
+        amplitude_to_ram(), and turns_amplitude_to_ram(), but all data are
+        converted with vectorized numpy operations.
+
+        Args:
+            dds: AD9910, the DDS that will playback the RAM profile.
+            data: np.ndarray of float, the RAM data. For polar RAM, each row
+                is a (phase, amplitude) pair. Data of any float precision
+                are scaled in float64, so the RAM words are identical to
+                those of the AD9910 driver.
+            ram_type: RAMType, see the RAMType enum.
+
+        Returns:
+            np.ndarray of np.int32, the encoded RAM words.
+
+        Raises:
+            ValueError: Amplitude out of range.
+        """
+        if ram_type == RAMType.FREQ:
+            # FTWs have 32-bits resolution, which float32 cannot represent.
+            data = data.astype(np.float64, copy=False)
+            ram = np.round(data * dds.ftw_per_hz).astype(np.int64)
+        elif ram_type == RAMType.PHASE:
+            ram = _turns_to_pow(data) << 16
+        elif ram_type == RAMType.AMP:
+            ram = _amplitude_to_asf(data) << 18
+        else:
+            # Empty data has shape (0,) instead of (0, 2).
+            data = data.reshape(-1, 2)
+            ram = (_turns_to_pow(data[:, 0]) << 16) | (_amplitude_to_asf(data[:, 1]) << 2)
+        # Words with the highest bit set wrap around to negative int32.
+        return ram.astype(np.int32)
+
 
 class RAMProfileMap:
     """A mapping between RAM profiles and the DDS that performs the playback.
@@ -31,7 +31,8 @@ class Scan(JaxExperiment):
     def run(self):
         try:
             self.host_startup()
-            while self._scans_finished < len(self.scanned_values):
+            num_of_scans = len(self.scanned_values)
+            while self._scans_finished < num_of_scans:
                 # blocks if a higher priority experiment takes control.
                 if self.check_stop_or_do_pause():
                     # if termination is requested.
@@ -58,9 +59,9 @@ class Scan(JaxExperiment):
     @kernel
     def kernel_run(self):
         self.kernel_before_loops()
-        for kk in range(len(self.scanned_values)):
-            if kk < self._scans_finished:
-                continue  # skips scanned points after pausing the experiment.
+        num_of_scans = len(self.scanned_values)
+        # skips scanned points after pausing the experiment.
+        for kk in range(self._scans_finished, num_of_scans):
             if self.CHECK_STOP:
                 if self.scheduler.check_pause():
                     break
@@ -1,6 +1,14 @@
+import functools
+
 from artiq.experiment import *
 
 
+@functools.lru_cache(maxsize=1024)
+def _dds_values_to_mu(dds, frequency, amplitude, turns):
+    return (dds.frequency_to_ftw(frequency), dds.turns_to_pow(turns),
+            dds.amplitude_to_asf(amplitude))
+
+
 class Sequence:
     """Base class for pulse sequences.
 
@@ -20,16 +28,38 @@ class Sequence:
 
     @classmethod
     def all_required_parameters(cls):
-        """Returns all required parameters in the sequence and its subsequences."""
-        parameters = list(cls.required_parameters)
+        """Returns all required parameters in the sequence and its subsequences.
+
+        Returns:
+            list of (collection, parameter), unique parameters in the order they are required.
+        """
+        parameters = dict.fromkeys(cls.required_parameters)
         for kk in cls.required_subsequences:
-            parameters.extend(kk.all_required_parameters())
-        return list(set(parameters))
+            parameters.update(dict.fromkeys(kk.all_required_parameters()))
+        return list(parameters)
 
     def __init__(self, exp, parameter_group):
         self.exp = exp
         self.p = parameter_group
 
+    @host_only
+    def dds_values_to_mu(self, dds, frequency, amplitude, turns=0.):
+        """Converts DDS values to machine units.
+
+        Results are cached for each DDS, so sequences that are constructed repeatedly with
+        the same parameters do not repeat the conversion.
+
+        Args:
+            dds: AD9910 device.
+            frequency: float, frequency in Hz.
+            amplitude: float, amplitude between 0 and 1.
+            turns: float, phase in turns. Default is 0.
+
+        Returns:
+            (ftw, pow, asf), machine units that can be passed to dds.set_mu().
+        """
+        return _dds_values_to_mu(dds, frequency, amplitude, turns)
+
     @kernel
     def run(self):
         """Override this function to construct the pulse sequence."""
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+
+import numpy as np
 from artiq.experiment import *
 from jax import JaxExperiment, SinaraEnvironment
 from jax.examples.sequences.example2 import Example2
@@ -8,6 +11,44 @@ from jax.util.drift_tracker import DriftTracker
 __all__ = ["PulseSequence"]
 
 
+_MOCK_PARAMETERS = {
+    "example2": {
+        "num_of_repeats": 1000,
+        "cool_time": 5*ms,
+        "wait_time": 5*us
+    },
+    "devices": {
+        "cool_dds": "dp_468",
+        "repump_dds": "dp_1079",
+        "pmt_edge_counter": "pmt_counter"
+    },
+    "state_detect": {
+        "cool_detuning": -20*MHz,
+        "cool_amplitude": 0.1,
+        "cool_drift_tracker": "468",
+        "repump_detuning": 20*MHz,
+        "repump_amplitude": 0.1,
+        "repump_drift_tracker": "1079",
+        "detect_time": 1*ms
+    },
+    "doppler_cool": {
+        "cool_detuning": -20*MHz,
+        "cool_amplitude": 0.05,
+        "cool_drift_tracker": "468",
+        "repump_detuning": 20*MHz,
+        "repump_amplitude": 0.05,
+        "repump_drift_tracker": "1079"
+    }
+}
+
+_MOCK_DRIFT_TRACKERS = {
+    "468": {"center_frequency": 260*MHz, "detuning_factor": -2, "center_drift_rate": 0.,
+            "last_calibration": 0., "Zeeman": None},
+    "1079": {"center_frequency": 105*MHz, "detuning_factor": -2, "center_drift_rate": 0.,
+             "last_calibration": 0., "Zeeman": None}
+}
+
+
 class PulseSequence(JaxExperiment, SinaraEnvironment):
     """Example experiment that contains a pulse sequence and demonstrates data saving.
 
@@ -27,8 +68,13 @@ class PulseSequence(JaxExperiment, SinaraEnvironment):
     artiq_master controls (see ARTIQ manual), and the experiment should show up after
     "scanning repository HEAD" using the experiment explorer in the artiq dashboard.
     """
+    kernel_invariants = {"num_of_repeats", "sequence"}
     USE_PARAMETER_BANK = False
     USE_DRIFT_TRACKER = False
+    # number of counts buffered in the kernel before they are saved by a RPC.
+    COUNTS_SAVE_INTERVAL = 64
+    # number of repetitions between checks of whether the experiment should pause or stop.
+    CHECK_PAUSE_INTERVAL = 128
 
     def build(self):
         super().build()
@@ -49,17 +95,17 @@ class PulseSequence(JaxExperiment, SinaraEnvironment):
         if not self.USE_DRIFT_TRACKER:
             self.get_mock_drift_trackers()
 
+        self.num_of_repeats = self.p.example2.num_of_repeats
         self.sequence = Example2(self, self.p, self.p.example2.cool_time, self.p.example2.wait_time)
+        # counts are saved in batches to avoid a RPC in every repetition.
+        self.counts_buffer = np.zeros(self.COUNTS_SAVE_INTERVAL, dtype=np.int32)
 
     def run(self):
-        try:
+        with self._session():
             self.repeats_done = 0  # tracks how many repeatitions have been done.
-            self.open_file()  # opens up a file for writing data.
-            # defines a instance variable that will be used in the kernel.
-            # instance variables cannot be defined in the kernel, but can be modified
-            # the variable's type is not changed.
+            # name of the counts dataset. It is set when the first counts are saved.
             self.counts_dset_name = ""
-            while self.repeats_done < self.p.example2.num_of_repeats:
+            while self.repeats_done < self.num_of_repeats:
                 # checks if user has stopped the experiment.
                 should_stop = self.check_stop_or_do_pause()
                 if should_stop:
@@ -67,71 +113,68 @@ class PulseSequence(JaxExperiment, SinaraEnvironment):
                 else:
                     self.turn_off_all_ddses()
                     self.run_kernel()
-        except Exception as e:
-            raise e
+
+    @contextmanager
+    def _session(self):
+        """Opens a data file, and cleans up when the experiment finishes or raises."""
+        try:
+            self.open_file()  # opens up a file for writing data.
+            yield
         finally:
             self.reset_sinara_hardware()  # resets the hardware to pre-experiment state.
             self.close_file()  # closes the data file.
             self.disconnect_labrad()  # closes the labrad connection.
 
     def get_mock_parameters(self):
-        """Change 'devices' section to set to valid device names."""
-        params = {
-            "example2": {
-                "num_of_repeats": 1000,
-                "cool_time": 5*ms,
-                "wait_time": 5*us
-            },
-            "devices": {
-                "cool_dds": "dp_468",
-                "repump_dds": "dp_1079",
-                "pmt_edge_counter": "pmt_counter"
-            },
-            "state_detect": {
-                "cool_detuning": -20*MHz,
-                "cool_amplitude": 0.1,
-                "cool_drift_tracker": "468",
-                "repump_detuning": 20*MHz,
-                "repump_amplitude": 0.1,
-                "repump_drift_tracker": "1079",
-                "detect_time": 1*ms
-            },
-            "doppler_cool": {
-                "cool_detuning": -20*MHz,
-                "cool_amplitude": 0.05,
-                "cool_drift_tracker": "468",
-                "repump_detuning": 20*MHz,
-                "repump_amplitude": 0.05,
-                "repump_drift_tracker": "1079"
-            }
-        }
-        self.p = ParameterGroup(params)
-        self.add_attribute("parameters", self.serialize(params))
+        """Change 'devices' section of _MOCK_PARAMETERS to set to valid device names."""
+        self.p = ParameterGroup(_MOCK_PARAMETERS)
+        self.add_attribute("parameters", self.serialize(_MOCK_PARAMETERS))
 
     def get_mock_drift_trackers(self):
         self.drift_trackers = {}
-        param_468 = {"center_frequency": 260*MHz, "detuning_factor": -2, "center_drift_rate": 0.,
-                     "last_calibration": 0., "Zeeman": None}
-        self.drift_trackers["468"] = DriftTracker(param_468)
-        self.add_attribute("468", self.serialize(param_468), "drift_trackers")
-        param_1079 = {"center_frequency": 105*MHz, "detuning_factor": -2, "center_drift_rate": 0.,
-                      "last_calibration": 0., "Zeeman": None}
-        self.drift_trackers["1079"] = DriftTracker(param_1079)
-        self.add_attribute("1079", self.serialize(param_1079), "drift_trackers")
+        attributes = {}
+        for name, param in _MOCK_DRIFT_TRACKERS.items():
+            # DriftTracker may modify the dict, so a copy is passed in.
+            self.drift_trackers[name] = DriftTracker(dict(param))
+            attributes[name] = self.serialize(param)
+        self.add_attributes(attributes, "drift_trackers")
+
+    @rpc(flags={"async"})
+    def save_counts(self, counts, num_of_counts):
+        """Saves buffered counts to the data file.
+
+        Args:
+            counts: np.ndarray of np.int32, buffered counts.
+            num_of_counts: int, number of valid counts at the start of the buffer.
+        """
+        counts = counts[:num_of_counts]
+        if self.counts_dset_name == "":
+            # initializes a dataset.
+            self.counts_dset_name = self.add_dataset("counts", counts)
+        else:
+            # appends to the dataset.
+            self.append_dataset(self.counts_dset_name, counts)
 
     @kernel
     def run_kernel(self):
         self.core.reset()
-        while self.repeats_done < self.p.example2.num_of_repeats:
-            # if the experiment should pause or stop. This function takes several ms to run.
-            if self.scheduler.check_pause():
-                break
+        num_of_repeats = self.num_of_repeats
+        scheduler = self.scheduler
+        num_of_buffered = 0
+        while self.repeats_done < num_of_repeats:
+            # if the experiment should pause or stop. This function takes several ms to run,
+            # so it is only called every CHECK_PAUSE_INTERVAL repetitions.
+            if self.repeats_done % self.CHECK_PAUSE_INTERVAL == 0:
+                if scheduler.check_pause():
+                    break
             self.core.break_realtime()
             count = self.sequence.run()  # runs the pulse sequence.
-            if self.repeats_done == 0:
-                # initializes a dataset.
-                self.counts_dset_name = self.add_dataset("counts", [count])
-            else:
-                # appends to the dataset.
-                self.append_dataset(self.counts_dset_name, [count])
+            self.counts_buffer[num_of_buffered] = count
+            num_of_buffered += 1
+            if num_of_buffered == self.COUNTS_SAVE_INTERVAL:
+                self.save_counts(self.counts_buffer, num_of_buffered)
+                num_of_buffered = 0
             self.repeats_done += 1
+        # saves the remaining counts before the kernel returns.
+        if num_of_buffered > 0:
+            self.save_counts(self.counts_buffer, num_of_buffered)
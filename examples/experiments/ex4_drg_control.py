@@ -30,17 +30,34 @@ class DRGExample(JaxExperiment, SinaraEnvironment):
 
     Before running this experiment, the DDS output should be terminated with a 50 ohm terminator.
     """
+    kernel_invariants = {
+        "cpld",
+        "ddses",
+        "dds0",
+        "dds1",
+        "dds2",
+        "dds3",
+        "dds_manager",
+        "single_tone_ftw",
+        "single_tone_asf",
+        "segment_time_mu",
+    }
+
     def build(self):
         super().build()  # Calls JaxExperiment.build(), which calls SinaraEnvironment.build()
         self.cpld = self.get_device("urukul0_cpld")
-        self.dds0 = self.get_device("urukul0_ch0")
-        self.dds1 = self.get_device("urukul0_ch1")
-        self.dds2 = self.get_device("urukul0_ch2")
-        self.dds3 = self.get_device("urukul0_ch3")
+        self.ddses = [self.get_device(f"urukul0_ch{kk}") for kk in range(4)]
+        self.dds0, self.dds1, self.dds2, self.dds3 = self.ddses
 
     def prepare(self):
         super().prepare()  # Calls JaxExperiment.prepare(), which calls SinaraEnvironment.prepare()
 
+        # Single-tone profile parameters, converted to machine units on the host.
+        self.single_tone_ftw = self.dds0.frequency_to_ftw(5*MHz)
+        self.single_tone_asf = self.dds0.amplitude_to_asf(0.2)
+        # Duration of each segment of the DDS output sequence.
+        self.segment_time_mu = self.core.seconds_to_mu(10*us)
+
         # The DRG waveform instances.
         # Specify step_gap="fine" and unspecify `num_of_steps` to minimize the step gap.
         drg_freq = DRG(self.dds0, 1*MHz, 10*MHz, 400*ns, DRGType.FREQ, num_of_steps=10)
@@ -91,14 +108,14 @@ class DRGExample(JaxExperiment, SinaraEnvironment):
         #   2. Turn on the RF switches and give appropriate attenuations.
         self.cpld.init()
 
-        self.init_dds(self.dds0)
-        self.init_dds(self.dds1)
-        self.init_dds(self.dds2)
-        self.init_dds(self.dds3)
+        for dds in self.ddses:
+            self.init_dds(dds)
 
         # Prepare a RAM profile & a single-tone profile
-        for dds in [self.dds0, self.dds1, self.dds2, self.dds3]:
-            dds.set(frequency=5*MHz, amplitude=0.2)
+        self.dds0.set_mu(self.single_tone_ftw, asf=self.single_tone_asf)
+        self.dds1.set_mu(self.single_tone_ftw, asf=self.single_tone_asf)
+        self.dds2.set_mu(self.single_tone_ftw, asf=self.single_tone_asf)
+        self.dds3.set_mu(self.single_tone_ftw, asf=self.single_tone_asf)
 
         self.dds_manager.load_profile()
 
@@ -114,16 +131,16 @@ class DRGExample(JaxExperiment, SinaraEnvironment):
         self.dds_manager.commit_enable()
         self.dds_manager.disable()
 
-        now += self.core.seconds_to_mu(10*us)
+        now += self.segment_time_mu
         at_mu(now)
         self.dds_manager.commit_disable()
         self.dds_manager.enable()
 
-        now += self.core.seconds_to_mu(10*us)
+        now += self.segment_time_mu
         at_mu(now)
         self.dds_manager.commit_enable()
         self.dds_manager.disable()
 
-        now += self.core.seconds_to_mu(10*us)
+        now += self.segment_time_mu
         at_mu(now)
         self.dds_manager.commit_disable()
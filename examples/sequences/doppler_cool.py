@@ -8,7 +8,9 @@ __all__ = ["DopplerCool"]
 class DopplerCool(Sequence):
     """An example Doppler cooling sequence."""
     kernel_invariants = {
-        "_cool_dds", "_repump_dds", "_cool_drift_tracker", "_repump_drift_tracker"
+        "_cool_dds", "_repump_dds", "_cool_drift_tracker", "_repump_drift_tracker",
+        "_cool_pow", "_repump_pow", "_cool_asf", "_repump_asf", "_cool_ftw", "_repump_ftw",
+        "_cool_time_mu"
     }
 
     required_parameters = [
@@ -36,23 +38,18 @@ class DopplerCool(Sequence):
         self._cool_dds = self.exp.get_device(self.p.devices.cool_dds)
         self._repump_dds = self.exp.get_device(self.p.devices.repump_dds)
 
-        phase = 0.
-        self._cool_pow = self._cool_dds.turns_to_pow(phase)
-        self._repump_pow = self._repump_dds.turns_to_pow(phase)
-
         d = self.p.doppler_cool
-        self._cool_asf = self._cool_dds.amplitude_to_asf(d.cool_amplitude)
-        self._repump_asf = self._repump_dds.amplitude_to_asf(d.repump_amplitude)
-
         self._cool_drift_tracker = self.exp.get_drift_tracker(d.cool_drift_tracker)
         self._repump_drift_tracker = self.exp.get_drift_tracker(d.repump_drift_tracker)
 
         self._cool_time_mu = self.exp.core.seconds_to_mu(cool_time)
 
         cool_frequency = self._cool_drift_tracker.get_frequency_host(d.cool_detuning)
-        self._cool_ftw = self._cool_dds.frequency_to_ftw(cool_frequency)
+        self._cool_ftw, self._cool_pow, self._cool_asf = self.dds_values_to_mu(
+            self._cool_dds, cool_frequency, d.cool_amplitude)
         repump_frequency = self._repump_drift_tracker.get_frequency_host(d.repump_detuning)
-        self._repump_ftw = self._repump_dds.frequency_to_ftw(repump_frequency)
+        self._repump_ftw, self._repump_pow, self._repump_asf = self.dds_values_to_mu(
+            self._repump_dds, repump_frequency, d.repump_amplitude)
 
     @kernel
     def run(self):
@@ -11,7 +11,9 @@ class StateDetect(Sequence):
     Turns on the cool and repump DDSes, and counts the PMT output.
     """
     kernel_invariants = {
-        "_cool_dds", "_repump_dds", "_cool_drift_tracker", "_repump_drift_tracker"
+        "_cool_dds", "_repump_dds", "_cool_drift_tracker", "_repump_drift_tracker",
+        "_cool_pow", "_repump_pow", "_cool_asf", "_repump_asf", "_cool_ftw", "_repump_ftw",
+        "_detect_time_mu", "pmt"
     }
 
     required_parameters = [
@@ -43,23 +45,18 @@ class StateDetect(Sequence):
         # pmt needs to be accessed in other classes.
         self.pmt = self.exp.get_device(self.p.devices.pmt_edge_counter)
 
-        phase = 0.
-        self._cool_pow = self._cool_dds.turns_to_pow(phase)
-        self._repump_pow = self._repump_dds.turns_to_pow(phase)
-
         s = self.p.state_detect
-        self._cool_asf = self._cool_dds.amplitude_to_asf(s.cool_amplitude)
-        self._repump_asf = self._repump_dds.amplitude_to_asf(s.repump_amplitude)
-
         self._cool_drift_tracker = self.exp.get_drift_tracker(s.cool_drift_tracker)
         self._repump_drift_tracker = self.exp.get_drift_tracker(s.repump_drift_tracker)
 
         self._detect_time_mu = self.exp.core.seconds_to_mu(s.detect_time)
 
-        cool_frequency = self._cool_drift_tracker.get_frequency_host(d.cool_detuning)
-        self._cool_ftw = self._cool_dds.frequency_to_ftw(cool_frequency)
-        repump_frequency = self._repump_drift_tracker.get_frequency_host(d.repump_detuning)
-        self._repump_ftw = self._repump_dds.frequency_to_ftw(repump_frequency)
+        cool_frequency = self._cool_drift_tracker.get_frequency_host(s.cool_detuning)
+        self._cool_ftw, self._cool_pow, self._cool_asf = self.dds_values_to_mu(
+            self._cool_dds, cool_frequency, s.cool_amplitude)
+        repump_frequency = self._repump_drift_tracker.get_frequency_host(s.repump_detuning)
+        self._repump_ftw, self._repump_pow, self._repump_asf = self.dds_values_to_mu(
+            self._repump_dds, repump_frequency, s.repump_amplitude)
 
     @kernel
     def run(self):
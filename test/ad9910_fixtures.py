@@ -0,0 +1,8 @@
+from artiq.coredevice.ad9910 import AD9910
+
+
+class DDS(AD9910):
+    """AD9910 with only the attributes used by the unit conversions."""
+    def __init__(self, sysclk=1e9):
+        self.sysclk = sysclk
+        self.ftw_per_hz = (1 << 32) / sysclk
@@ -0,0 +1,135 @@
+import unittest
+
+import numpy as np
+from artiq.language.units import ns
+from jax.base.experiments.ad9910_drg import DRG, DRGType
+from jax.test.ad9910_fixtures import DDS
+
+
+def _baseline_drg(dds, start, end, ramp_interval, drg_type,
+                  num_of_steps=None, step_gap=None, dwell_high=True):
+    """DRG.__init__() conversion before it was factored into _drg_to_mu().
+
+    Returns:
+        (rate, low, high, step).
+    """
+    rate = int(ramp_interval * dds.sysclk / 4.0)
+    step = None
+    if drg_type == DRGType.FREQ:
+        start_mu = dds.frequency_to_ftw(start).astype('uint32')
+        high = dds.frequency_to_ftw(end).astype('uint32')
+        if step_gap is not None:
+            if step_gap == "fine":
+                step = np.uint32(1)
+            else:
+                step = dds.frequency_to_ftw(step_gap).astype('uint32')
+    elif drg_type == DRGType.PHASE:
+        def _turns_to_drg_args(turns):
+            pow_ = round(turns * (2**32))
+            if pow_ < 0 or pow_ > (2**32 - 1):
+                raise ValueError("Phase parameter does not wrap around in DRG")
+            return np.uint32(pow_)
+
+        start_mu = _turns_to_drg_args(start)
+        high = _turns_to_drg_args(end)
+        if step_gap is not None:
+            if step_gap == "fine":
+                step = np.uint32(1 << 16)
+            else:
+                step = _turns_to_drg_args(step_gap).astype('uint32')
+    else:
+        def _amplitude_to_drg_regs(amplitude):
+            if amplitude < 0.0 or amplitude > 1.0:
+                raise ValueError("Amplitude parameter exceeds DRG limits")
+            return np.uint32(amplitude * 0xFFFFFFFF)
+
+        start_mu = _amplitude_to_drg_regs(start)
+        high = _amplitude_to_drg_regs(end)
+        if step_gap is not None:
+            if step_gap == "fine":
+                step = np.uint32(1 << 18)
+            else:
+                step = _amplitude_to_drg_regs(step_gap).astype('uint32')
+
+    if high <= start_mu:
+        raise ValueError("Upper limit of DRG must be higher than the lower limit of DRG")
+    if num_of_steps is not None:
+        step = (high - start_mu)//(num_of_steps - 1)
+    if dwell_high != ((high + step) < 2**32):
+        raise ValueError("Inconsistent DRG dwell high behavior")
+    if start_mu < step:
+        raise ValueError("start value too low")
+    low = start_mu - step
+    return rate, low.astype('int32'), high.astype('int32'), step.astype('int32')
+
+
+def _drg_mu(drg):
+    return drg.rate, drg.low, drg.high, drg.step
+
+
+class TestDRG(unittest.TestCase):
+    def setUp(self):
+        self.dds = DDS()
+
+    def test_matches_baseline(self):
+        cases = [
+            (1e6, 100e6, 4*ns, DRGType.FREQ, {"num_of_steps": 1000}),
+            (1e6, 100e6, 8*ns, DRGType.FREQ, {"step_gap": "fine"}),
+            (1e6, 100e6, 8*ns, DRGType.FREQ, {"step_gap": 12.5e3}),
+            (0.5 / 2500, 0.5, 4*ns, DRGType.PHASE, {"num_of_steps": 2500}),
+            (0.1, 0.4, 4*ns, DRGType.PHASE, {"step_gap": "fine"}),
+            (0.01, 0.99, 80*ns, DRGType.AMP, {"num_of_steps": 99}),
+            (0.1, 0.9, 80*ns, DRGType.AMP, {"step_gap": 0.05}),
+            (0.1, 0.9, 80*ns, DRGType.AMP, {"step_gap": "fine"}),
+        ]
+        for start, end, ramp_interval, drg_type, kwargs in cases:
+            with self.subTest(start=start, end=end, drg_type=drg_type, **kwargs):
+                expected = _baseline_drg(self.dds, start, end, ramp_interval, drg_type, **kwargs)
+                drg = DRG(self.dds, start, end, ramp_interval, drg_type, **kwargs)
+                self.assertEqual(_drg_mu(drg), expected)
+                self.assertEqual(drg.dest, drg_type.value)
+                # the cached conversion returns the same values.
+                drg = DRG(self.dds, start, end, ramp_interval, drg_type, **kwargs)
+                self.assertEqual(_drg_mu(drg), expected)
+
+    def test_invalid_matches_baseline(self):
+        cases = [
+            (0.5, 0.1, 4*ns, DRGType.PHASE, {"num_of_steps": 10}),
+            (0.0, 0.5, 4*ns, DRGType.AMP, {"num_of_steps": 10}),
+            (0.1, 1.5, 4*ns, DRGType.AMP, {"num_of_steps": 10}),
+        ]
+        for start, end, ramp_interval, drg_type, kwargs in cases:
+            with self.subTest(start=start, end=end, drg_type=drg_type, **kwargs):
+                with self.assertRaises(ValueError):
+                    _baseline_drg(self.dds, start, end, ramp_interval, drg_type, **kwargs)
+                with self.assertRaises(ValueError):
+                    DRG(self.dds, start, end, ramp_interval, drg_type, **kwargs)
+
+    def test_from_mu_matches_float(self):
+        num_of_steps = 2500
+        half_turn_mu = 1 << 31
+        drg_mu = DRG.from_mu(half_turn_mu // num_of_steps, half_turn_mu, 1,
+                             DRGType.PHASE, num_of_steps=num_of_steps)
+        drg = DRG(self.dds, 0.5 / num_of_steps, 0.5, 4*ns, DRGType.PHASE,
+                  num_of_steps=num_of_steps)
+        self.assertEqual(_drg_mu(drg_mu), _drg_mu(drg))
+        self.assertEqual(drg_mu.dest, drg.dest)
+        self.assertEqual(drg_mu.drg_type, drg.drg_type)
+
+    def test_from_mu_step(self):
+        drg = DRG.from_mu(1 << 20, 1 << 30, 2, DRGType.FREQ, step_mu=1 << 16)
+        self.assertEqual(_drg_mu(drg), (2, (1 << 20) - (1 << 16), 1 << 30, 1 << 16))
+
+    def test_from_mu_invalid(self):
+        with self.assertRaises(ValueError):
+            DRG.from_mu(-1, 1 << 30, 1, DRGType.FREQ, num_of_steps=10)
+        with self.assertRaises(ValueError):
+            DRG.from_mu(1 << 20, 1 << 32, 1, DRGType.FREQ, num_of_steps=10)
+        with self.assertRaises(ValueError):
+            DRG.from_mu(1 << 20, 1 << 30, 1, DRGType.FREQ, num_of_steps=10, step_mu=1)
+        with self.assertRaises(ValueError):
+            DRG.from_mu(1 << 20, 1 << 30, 1, DRGType.FREQ)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+from artiq.coredevice.ad9910 import RAM_MODE_RAMPUP
+from artiq.language.units import ns
+from jax.base.experiments.ad9910_ram import RAMProfile, RAMType
+from jax.test.ad9910_fixtures import DDS
+
+
+def _driver_ram(dds, data, ram_type):
+    """Encodes RAM words with the scalar AD9910 driver conversions.
+
+    Kernel floats are float64, so the data are converted to Python floats first.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    ram = [0] * len(data)
+    if ram_type == RAMType.FREQ:
+        dds.frequency_to_ram(data.tolist(), ram)
+    elif ram_type == RAMType.PHASE:
+        dds.turns_to_ram(data.tolist(), ram)
+    elif ram_type == RAMType.AMP:
+        dds.amplitude_to_ram(data.tolist(), ram)
+    else:
+        dds.turns_amplitude_to_ram(data[:, 0].tolist(), data[:, 1].tolist(), ram)
+    # Words with the highest bit set may be Python ints above the int32 range.
+    return np.array([int(word) for word in ram], dtype=np.int64).astype(np.int32)
+
+
+def _baseline_ram(dds, data, ram_type):
+    """Encodes RAM words like RAMProfile did before the vectorized encoder.
+
+    Args:
+        data: list of float, or list of (phase, amplitude) tuples for polar RAM.
+    """
+    ram = np.zeros((len(data),), dtype=np.int32)
+    data = data.copy()
+    data.reverse()
+    if ram_type == RAMType.FREQ:
+        dds.frequency_to_ram(data, ram)
+    elif ram_type == RAMType.PHASE:
+        dds.turns_to_ram(data, ram)
+    elif ram_type == RAMType.AMP:
+        dds.amplitude_to_ram(data, ram)
+    else:
+        phase, amp = zip(*data)
+        dds.turns_amplitude_to_ram(phase, amp, ram)
+    return list(ram)
+
+
+class TestRAMProfile(unittest.TestCase):
+    def test_matches_scalar_encoder(self):
+        dds = DDS()
+        rng = np.random.default_rng(1)
+        size = RAMProfile.RAM_SIZE
+        phase = rng.uniform(-2.0, 2.0, size).tolist()
+        amp = rng.uniform(0.0, 1.0, size).tolist()
+        data = {
+            RAMType.FREQ: rng.uniform(0.0, 400e6, size).tolist(),
+            RAMType.PHASE: phase,
+            RAMType.AMP: amp,
+            RAMType.POLAR: list(zip(phase, amp)),
+        }
+        for ram_type in RAMType:
+            with self.subTest(ram_type=ram_type):
+                profile = RAMProfile(dds, data[ram_type], 400*ns, ram_type, RAM_MODE_RAMPUP)
+                expected = _baseline_ram(dds, data[ram_type], ram_type)
+                self.assertEqual(len(profile.ram), len(expected))
+                for kk, (word, expected_word) in enumerate(zip(profile.ram, expected)):
+                    self.assertEqual(word, expected_word, f"RAM word {kk}")
+
+
+class TestToMuArray(unittest.TestCase):
+    def setUp(self):
+        self.dds = DDS()
+        rng = np.random.default_rng(0)
+        size = 10000
+        amp = rng.uniform(0.0, 1.0, size)
+        # float32 rounds this amplitude to a different ASF unless scaled in float64.
+        amp[0] = np.float32(0.51013243)
+        phase = rng.uniform(-2.0, 2.0, size)
+        self.data = {
+            RAMType.FREQ: rng.uniform(0.0, 400e6, size),
+            RAMType.PHASE: phase,
+            RAMType.AMP: amp,
+            RAMType.POLAR: np.stack([phase, amp], axis=1),
+        }
+
+    def _check(self, ram_type, dtype):
+        data = self.data[ram_type].astype(dtype)
+        ram = RAMProfile._to_mu_array(self.dds, data, ram_type)
+        self.assertEqual(ram.dtype, np.int32)
+        np.testing.assert_array_equal(ram, _driver_ram(self.dds, data, ram_type))
+
+    def test_matches_driver(self):
+        for ram_type in RAMType:
+            for dtype in (np.float32, np.float64):
+                with self.subTest(ram_type=ram_type, dtype=dtype):
+                    self._check(ram_type, dtype)
+
+    def test_empty(self):
+        for ram_type in RAMType:
+            with self.subTest(ram_type=ram_type):
+                data = np.asarray([])[::-1]
+                ram = RAMProfile._to_mu_array(self.dds, data, ram_type)
+                self.assertEqual(ram.shape, (0,))
+                self.assertEqual(ram.dtype, np.int32)
+
+    def test_invalid_amplitude(self):
+        for ram_type, data in [(RAMType.AMP, np.array([0.5, 1.1])),
+                               (RAMType.POLAR, np.array([[0.0, 0.5], [0.0, -0.1]]))]:
+            with self.subTest(ram_type=ram_type):
+                with self.assertRaises(ValueError):
+                    RAMProfile._to_mu_array(self.dds, data, ram_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
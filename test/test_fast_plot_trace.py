@@ -0,0 +1,133 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from jax.util.ui import fast_plot_trace
+from jax.util.ui.fast_plot_trace import FastPlotTrace, _append_to_buffer
+
+
+class _PlotPath:
+    """Records the data of each path instead of building a QGraphicsPathItem."""
+    def __init__(self, x, y, pen):
+        self.x = np.array(x)
+        self.y = np.array(y)
+
+
+class _PlotDataItem:
+    def __init__(self, x, y):
+        self.setData(x, y)
+
+    def setData(self, x, y):
+        # copies the data as the trace reuses its buffers.
+        self.x = np.array(x)
+        self.y = np.array(y)
+
+
+class _PlotWidget:
+    def __init__(self):
+        self.items = []
+        self.data_item = None
+
+    def addItem(self, item):
+        self.items.append(item)
+
+    def removeItem(self, item):
+        if item is self.data_item:
+            self.data_item = None
+        else:
+            self.items.remove(item)
+
+    def plot(self, x, y, pen=None, name=None):
+        self.data_item = _PlotDataItem(x, y)
+        return self.data_item
+
+
+class TestAppendToBuffer(unittest.TestCase):
+    def test_append(self):
+        buffer, length = np.array([0.0, 1.0]), 2
+        expected = [0.0, 1.0]
+        for kk in range(2, 100):
+            data = np.arange(kk, kk + kk % 4, dtype=float)
+            expected.extend(data)
+            buffer, length = _append_to_buffer(buffer, length, data)
+            self.assertEqual(length, len(expected))
+            self.assertGreaterEqual(len(buffer), length)
+            np.testing.assert_array_equal(buffer[:length], expected)
+
+    def test_grows_geometrically(self):
+        buffer, length = np.zeros(4), 4
+        buffer, length = _append_to_buffer(buffer, length, [1.0])
+        self.assertEqual(len(buffer), 8)
+        old_buffer = buffer
+        buffer, length = _append_to_buffer(buffer, length, [2.0, 3.0])
+        self.assertIs(buffer, old_buffer)
+        np.testing.assert_array_equal(buffer[:length], [0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0])
+
+    def test_empty(self):
+        buffer, length = _append_to_buffer(np.zeros(0), 0, [])
+        self.assertEqual(length, 0)
+        buffer, length = _append_to_buffer(buffer, length, [1.0, 2.0])
+        np.testing.assert_array_equal(buffer[:length], [1.0, 2.0])
+
+    def test_promotes_dtype(self):
+        buffer, length = _append_to_buffer(np.array([1, 2]), 2, [0.5])
+        self.assertEqual(buffer.dtype, np.float64)
+        np.testing.assert_array_equal(buffer[:length], [1.0, 2.0, 0.5])
+
+    def test_multidimensional(self):
+        buffer, length = _append_to_buffer(np.zeros((1, 2)), 1, [[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(buffer.shape[1:], (2,))
+        np.testing.assert_array_equal(buffer[:length], [[0.0, 0.0], [1.0, 2.0], [3.0, 4.0]])
+
+
+@mock.patch.object(fast_plot_trace, "_PlotPath", _PlotPath)
+class TestFastPlotTrace(unittest.TestCase):
+    length_to_path = 10
+
+    def setUp(self):
+        self.plot_widget = _PlotWidget()
+        self.trace = FastPlotTrace(self.plot_widget, length_to_path=self.length_to_path)
+
+    def _check(self, x, y):
+        """Checks that the paths and the plotted data cover the data like the old np.append
+        implementation, which sliced the data after every path.
+        """
+        paths = self.plot_widget.items
+        for path in paths:
+            np.testing.assert_array_equal(path.x, x[:self.length_to_path])
+            np.testing.assert_array_equal(path.y, y[:self.length_to_path])
+            x = x[self.length_to_path - 1:]
+            y = y[self.length_to_path - 1:]
+        self.assertLessEqual(len(x), self.length_to_path)
+        np.testing.assert_array_equal(self.plot_widget.data_item.x, x)
+        np.testing.assert_array_equal(self.plot_widget.data_item.y, y)
+
+    def test_append(self):
+        x = np.arange(200, dtype=float)
+        y = x**2
+        self.trace.set(x[:3], y[:3])
+        start = 3
+        for size in [1, 2, 5, 9, 10, 11, 25, 1, 40, 0, 7]:
+            self.trace.append(x[start:start + size], y[start:start + size])
+            start += size
+            self._check(x[:start], y[:start])
+
+    def test_append_x_ahead_of_y(self):
+        x = np.arange(50, dtype=float)
+        y = -x
+        self.trace.set(x[:5], y[:5])
+        self.trace.append(x[5:30], y[5:20])
+        self._check(x[:20], y[:20])
+        self.trace.append_y(y[20:30])
+        self.trace.update_trace()
+        self._check(x[:30], y[:30])
+
+    def test_set_replaces_trace(self):
+        x = np.arange(30, dtype=float)
+        self.trace.set(x, x)
+        self.trace.set(x[:5], 2 * x[:5])
+        self._check(x[:5], 2 * x[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
+import asyncio
 import pickle
-import time
 
 from artiq.applets.simple import SimpleApplet
 from jax import JaxApplet
@@ -13,6 +13,11 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
     # a signal is needed to run self.initialize_channels on the default thread.
     # widgets can only be created in the default thread.
     do_initialize = QtCore.pyqtSignal()
+    # signal emitted when a DDS is changed. (channel, attribute, value)
+    # the widgets are updated on the default thread.
+    do_update = QtCore.pyqtSignal(object)
+    # monitor updates are applied at most once in this interval.
+    UPDATE_INTERVAL_MS = 33
 
     def __init__(self, args, **kwds):
         super().__init__(**kwds)
@@ -20,7 +25,14 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
         self.setDisabled(
             True
         )  # start with the applet disabled, until artiq server is connected.
+        self.channels = {}
+        self._pending_updates = {}  # {(channel, attribute): value}
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._apply_updates)
         self.do_initialize.connect(self.initialize_channels)
+        self.do_update.connect(self._queue_update)
 
         self.initialize_gui()
         self.load_config_file("dds", args)
@@ -29,6 +41,9 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
 
     def initialize_gui(self):
         self.list_widget = CustomListWidget()
+        self.list_widget.visibility_and_order_changed.connect(
+            self.list_widget_reordered
+        )
         self.setWidget(self.list_widget)
 
     async def labrad_connected(self):
@@ -38,17 +53,19 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
 
     async def artiq_connected(self):
         self.artiq = self.cxn.get_server("artiq")
-        initialize_now = await self.artiq.is_dds_initialized()
-        if initialize_now:
-            await self.get_dds_parameters()
-
         SIGNALID = 124890
-        await self.artiq.on_dds_change(SIGNALID)
+        # the three requests are independent, so they are sent without waiting for each other.
+        initialize_now, _, _ = await asyncio.gather(
+            self.artiq.is_dds_initialized(),
+            self.artiq.on_dds_change(SIGNALID),
+            self.artiq.on_dds_initialize(SIGNALID + 1),
+        )
         self.artiq.addListener(listener=self._dds_changed, source=None, ID=SIGNALID)
-        await self.artiq.on_dds_initialize(SIGNALID + 1)
         self.artiq.addListener(
             listener=self._dds_initialized, source=None, ID=SIGNALID + 1
         )
+        if initialize_now:
+            await self.get_dds_parameters()
 
     async def get_dds_parameters(self):
         self.params = await self.artiq.get_dds_parameters()
@@ -61,30 +78,27 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
     def initialize_channels(self):
         self.channels = {}
         self.list_widget.clear()
-        for channel in self.params:
-            cpld = "Not implemented"  # current code does not query the cpld name.
-            frequency = self.params[channel][0]
-            phase = self.params[channel][1]
-            amp = self.params[channel][2]
-            att = self.params[channel][3]
-            state = self.params[channel][4] > 0
-            channel_param = DDSParameters(
-                self, channel, cpld, amp, att, frequency, phase, state
-            )
-            channel_widget = DDSChannel(channel_param, self)
-            self.channels[channel] = channel_widget
-            self._still_looping = False
-
-            self.list_widget.add_item_and_widget(channel, channel_widget)
+        cpld = "Not implemented"  # current code does not query the cpld name.
+        # repaints once after all channels are added instead of after each channel.
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for channel, (frequency, phase, amp, att, state) in self.params.items():
+                state = state > 0
+                channel_param = DDSParameters(
+                    self, channel, cpld, amp, att, frequency, phase, state
+                )
+                channel_widget = DDSChannel(channel_param, self)
+                self.channels[channel] = channel_widget
+
+                self.list_widget.add_item_and_widget(channel, channel_widget)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
         if "list_widget" not in self.config:
             self.config["list_widget"] = {}
         self.list_widget_reordered(
             self.list_widget.set_visibility_and_order(self.config["list_widget"])
         )
-        self.list_widget.visibility_and_order_changed.connect(
-            self.list_widget_reordered
-        )
 
     def list_widget_reordered(self, widget_config):
         self.config["list_widget"] = widget_config
@@ -98,15 +112,25 @@ class DDS(QtWidgets.QDockWidget, JaxApplet):
         self.setDisabled(True)
 
     def _dds_changed(self, signal, value):
+        self.do_update.emit(value)
+
+    @QtCore.pyqtSlot(object)
+    def _queue_update(self, value):
+        """Stores the latest value of each attribute until the next GUI update."""
         channel, attribute, val = value
-        if attribute == "frequency":
-            self.channels[channel].on_monitor_freq_changed(val)
-        elif attribute == "amplitude":
-            self.channels[channel].on_monitor_amp_changed(val)
-        elif attribute == "attenuation":
-            self.channels[channel].on_monitor_att_changed(val)
-        elif attribute == "state":
-            self.channels[channel].on_monitor_switch_changed(val > 0.0)
+        self._pending_updates[(channel, attribute)] = val
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _apply_updates(self):
+        updates = self._pending_updates
+        self._pending_updates = {}
+        for (channel, attribute), val in updates.items():
+            if channel not in self.channels:
+                continue
+            handler = self.channels[channel].monitor_handlers.get(attribute)
+            if handler is not None:
+                handler(val)
 
     def _dds_initialized(self, signal, value):
         self.run_in_labrad_loop(self.get_dds_parameters)()
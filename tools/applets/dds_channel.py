@@ -2,8 +2,84 @@ from jax.util.ui.dialog_on_top import DialogOnTop
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
+# delay in ms before a spinbox value is sent to the artiq server.
+# changes within the delay are merged so scrolling through values sends one update.
+_DEBOUNCE_INTERVAL_MS = 100
+
+
+def _debounce_timer(parent, slot):
+    """Returns a single shot timer that calls slot when it times out."""
+    timer = QtCore.QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(_DEBOUNCE_INTERVAL_MS)
+    timer.timeout.connect(slot)
+    return timer
+
+
+# decimals shown in the spinboxes.
+_FREQUENCY_DECIMALS = 3  # MHz.
+_AMPLITUDE_DECIMALS = 5
+_ATT_DECIMALS = 1  # dB.
+
+
+def _display_tolerance(decimals, scale=1.0):
+    """Returns half of the last displayed digit, multiplied by scale.
+
+    Smaller changes are only rounding of the displayed value.
+    """
+    return 0.5 * 10**-decimals * scale
+
+
+_fonts = None
+
+
+def _get_fonts():
+    """Returns fonts shared by all DDS widgets.
+
+    Fonts are created on the first call as they can only be created after QApplication.
+    """
+    global _fonts
+    if _fonts is None:
+        _fonts = {
+            "title": QtGui.QFont("Arial", 10),
+            "label": QtGui.QFont("Arial", 8),
+            "button": QtGui.QFont("Arial", 10),
+            "spinbox": QtGui.QFont("Arial", 10),
+        }
+    return _fonts
+
+
+def _make_label(text, font):
+    """Returns a fixed size label."""
+    label = QtWidgets.QLabel(text)
+    label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+    label.setFont(font)
+    return label
+
+
+def _make_spinbox(decimals, minimum, maximum, step, font):
+    """Returns a spinbox that only emits valueChanged when editing is finished."""
+    spinbox = QtWidgets.QDoubleSpinBox()
+    spinbox.setDecimals(decimals)
+    spinbox.setMinimum(minimum)
+    spinbox.setMaximum(maximum)
+    spinbox.setSingleStep(step)
+    spinbox.setFont(font)
+    spinbox.setKeyboardTracking(False)
+    return spinbox
+
+
 class DDSParameters:
-    """Stores DDS parameters and calls the artiq server when changes are made."""
+    """Stores DDS parameters and calls the artiq server when changes are made.
+
+    Changes made while a request to the artiq server is in progress are merged, and only
+    the latest value of each attribute is sent after the request finishes.
+    """
+    # changes within the display resolution of the spinboxes are not sent.
+    _AMPLITUDE_TOLERANCE = _display_tolerance(_AMPLITUDE_DECIMALS)
+    _ATT_TOLERANCE = _display_tolerance(_ATT_DECIMALS)
+    _FREQUENCY_TOLERANCE = _display_tolerance(_FREQUENCY_DECIMALS, 1.0e6)  # Hz.
+    _PHASE_TOLERANCE = 1e-9  # phase is not displayed, so only float rounding is ignored.
 
     def __init__(self, parent, channel, cpld, amplitude, att, frequency, phase, state):
         self.parent = parent
@@ -14,6 +90,9 @@ class DDSParameters:
         self._frequency = frequency
         self._phase = phase
         self._state = state
+        # {attribute: value} waiting to be sent. Only accessed in the labrad event loop.
+        self._pending_changes = {}
+        self._sending_changes = False
 
     @property
     def amplitude(self):
@@ -36,27 +115,19 @@ class DDSParameters:
         return self._state
 
     def set_amplitude(self, value, update=True):
-        if value != self._amplitude and update:
-            command = (self.channel, "amplitude", value)
-            self._change_dds(command)
+        self._maybe_change("amplitude", value, self._amplitude, self._AMPLITUDE_TOLERANCE, update)
         self._amplitude = value
 
     def set_att(self, value, update=True):
-        if value != self._att and update:
-            command = (self.channel, "attenuation", value)
-            self._change_dds(command)
+        self._maybe_change("attenuation", value, self._att, self._ATT_TOLERANCE, update)
         self._att = value
 
     def set_frequency(self, value, update=True):
-        if value != self._frequency and update:
-            command = (self.channel, "frequency", value)
-            self._change_dds(command)
+        self._maybe_change("frequency", value, self._frequency, self._FREQUENCY_TOLERANCE, update)
         self._frequency = value
 
     def set_phase(self, value, update=True):
-        if value != self._phase and update:
-            command = (self.channel, "phase", value)
-            self._change_dds(command)
+        self._maybe_change("phase", value, self._phase, self._PHASE_TOLERANCE, update)
         self._phase = value
 
     def set_state(self, value, update=True):
@@ -69,11 +140,28 @@ class DDSParameters:
             self._change_dds(command)
         self._state = value
 
-    def _change_dds(self, command):
-        async def worker(self, command):
-            await self.parent.artiq.set_dds(command)
+    def _maybe_change(self, attribute, value, old_value, tolerance, update):
+        """Sends the change to the artiq server if update is True and the change is larger
+        than tolerance, so float rounding in the GUI does not send spurious changes."""
+        if update and abs(value - old_value) > tolerance:
+            self._change_dds((self.channel, attribute, value))
 
-        self.parent.run_in_labrad_loop(worker)(self, command)
+    def _change_dds(self, command):
+        self.parent.run_in_labrad_loop(self._queue_change)(command)
+
+    async def _queue_change(self, command):
+        channel, attribute, value = command
+        self._pending_changes[attribute] = value
+        if self._sending_changes:  # the running loop below sends the latest value.
+            return
+        self._sending_changes = True
+        try:
+            while len(self._pending_changes) > 0:
+                attribute = next(iter(self._pending_changes))
+                value = self._pending_changes.pop(attribute)
+                await self.parent.artiq.set_dds((channel, attribute, value))
+        finally:
+            self._sending_changes = False
 
 
 class DDSDetail(DialogOnTop):
@@ -89,51 +177,60 @@ class DDSDetail(DialogOnTop):
     def initialize_gui(self):
         grid = QtWidgets.QGridLayout()
         self.setLayout(grid)
-        labelfont = QtGui.QFont("Arial", 8)
-        spinboxfont = QtGui.QFont("Arial", 10)
-
-        label = QtWidgets.QLabel(f"CPLD: {self.dds_parameters.cpld}")
-        label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        label.setFont(labelfont)
-        grid.addWidget(label, 0, 0)
-
-        label = QtWidgets.QLabel("Att (dB)")
-        label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        label.setFont(labelfont)
-        grid.addWidget(label, 1, 0)
-
-        self.att_box = QtWidgets.QDoubleSpinBox()
-        self.att_box.setDecimals(1)
-        self.att_box.setMinimum(-31.5)
-        self.att_box.setMaximum(0.0)
-        self.att_box.setSingleStep(0.5)
-        self.att_box.setFont(spinboxfont)
-        self.att_box.setKeyboardTracking(False)
+        fonts = _get_fonts()
+        labelfont = fonts["label"]
+        spinboxfont = fonts["spinbox"]
+
+        grid.addWidget(_make_label(f"CPLD: {self.dds_parameters.cpld}", labelfont), 0, 0)
+        grid.addWidget(_make_label("Att (dB)", labelfont), 1, 0)
+
+        self.att_box = _make_spinbox(_ATT_DECIMALS, -31.5, 0.0, 0.5, spinboxfont)
         self.att_box.setValue(-self.dds_parameters.att)
         grid.addWidget(self.att_box, 2, 0)
 
     def setup_gui_listeners(self):
+        self.att_timer = _debounce_timer(self, self.send_att)
         self.att_box.valueChanged.connect(self.on_widget_att_changed)
+        self.finished.connect(self.on_finished)
 
     def on_widget_att_changed(self, val):
-        self.dds_parameters.set_att(-val)
+        self.att_timer.start()
+
+    def on_finished(self, result):
+        # the dialog and its timer are deleted on close, so a pending change is sent now.
+        if self.att_timer.isActive():
+            self.att_timer.stop()
+            self.send_att()
+
+    def send_att(self):
+        self.dds_parameters.set_att(-self.att_box.value())
 
 
 class DDSChannel(QtWidgets.QGroupBox):
     """GUI for a DDS channel."""
     MHz_to_Hz = 1.0e6
+    Hz_to_MHz = 1.0e-6
 
     def __init__(self, dds_parameters, parent=None):
         self.dds_parameters = dds_parameters
         super().__init__(parent)
+        self.details = None
         self.initialize_gui()
         self.setup_gui_listeners()
+        # maps attribute names from the artiq server to monitor update handlers.
+        self.monitor_handlers = {
+            "frequency": self.on_monitor_freq_changed,
+            "amplitude": self.on_monitor_amp_changed,
+            "attenuation": self.on_monitor_att_changed,
+            "state": lambda val: self.on_monitor_switch_changed(val > 0.0),
+        }
 
     def initialize_gui(self):
-        titlefont = QtGui.QFont("Arial", 10)
-        labelfont = QtGui.QFont("Arial", 8)
-        buttonfont = QtGui.QFont("Arial", 10)
-        spinboxfont = QtGui.QFont("Arial", 10)
+        fonts = _get_fonts()
+        titlefont = fonts["title"]
+        labelfont = fonts["label"]
+        buttonfont = fonts["button"]
+        spinboxfont = fonts["spinbox"]
 
         grid = QtWidgets.QGridLayout()
         self.setLayout(grid)
@@ -147,36 +244,17 @@ class DDSChannel(QtWidgets.QGroupBox):
         label.setFont(titlefont)
         grid.addWidget(label, 0, 0, 1, 3)
 
-        label = QtWidgets.QLabel("Frequency (MHz)")
-        label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        label.setFont(labelfont)
-        grid.addWidget(label, 1, 0)
-
-        label = QtWidgets.QLabel("Amplitude")
-        label.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        label.setFont(labelfont)
-        grid.addWidget(label, 1, 1)
-
-        self.freq_box = QtWidgets.QDoubleSpinBox()
-        self.freq_box.setDecimals(3)
-        self.freq_box.setMinimum(1.0)
-        self.freq_box.setMaximum(500.0)
-        self.freq_box.setSingleStep(0.1)
-        self.freq_box.setFont(spinboxfont)
-        self.freq_box.setKeyboardTracking(False)
-        self.freq_box.setValue(self.dds_parameters.frequency / self.MHz_to_Hz)
+        grid.addWidget(_make_label("Frequency (MHz)", labelfont), 1, 0)
+        grid.addWidget(_make_label("Amplitude", labelfont), 1, 1)
+
+        self.freq_box = _make_spinbox(_FREQUENCY_DECIMALS, 1.0, 500.0, 0.1, spinboxfont)
+        self.freq_box.setValue(self.dds_parameters.frequency * self.Hz_to_MHz)
         grid.addWidget(self.freq_box, 2, 0)
 
-        self.amp_box = QtWidgets.QDoubleSpinBox()
-        self.amp_box.setDecimals(5)
-        self.amp_box.setMinimum(0.0)
-        self.amp_box.setMaximum(1.0)
-        self.amp_box.setSingleStep(0.01)
-        self.amp_box.setFont(spinboxfont)
+        self.amp_box = _make_spinbox(_AMPLITUDE_DECIMALS, 0.0, 1.0, 0.01, spinboxfont)
         self.amp_box.setSizePolicy(
             QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred
         )
-        self.amp_box.setKeyboardTracking(False)
         self.amp_box.setValue(self.dds_parameters.amplitude)
         grid.addWidget(self.amp_box, 2, 1)
 
@@ -191,40 +269,52 @@ class DDSChannel(QtWidgets.QGroupBox):
             self.set_switch_button_text(self.dds_parameters.state)
         grid.addWidget(self.switch_button, 2, 2)
 
+        self.context_menu = QtWidgets.QMenu(self)
+        details_action = self.context_menu.addAction("Details")
+        details_action.triggered.connect(self.show_details)
+
     def setup_gui_listeners(self):
+        self.freq_timer = _debounce_timer(self, self.send_freq)
+        self.amp_timer = _debounce_timer(self, self.send_amp)
         self.freq_box.valueChanged.connect(self.on_widget_freq_changed)
         self.amp_box.valueChanged.connect(self.on_widget_amp_changed)
         self.switch_button.clicked.connect(self.on_widget_switch_changed)
 
     def on_widget_freq_changed(self, val):
-        self.dds_parameters.set_frequency(val * self.MHz_to_Hz)
+        self.freq_timer.start()
 
     def on_widget_amp_changed(self, val):
-        self.dds_parameters.set_amplitude(val)
+        self.amp_timer.start()
+
+    def send_freq(self):
+        self.dds_parameters.set_frequency(self.freq_box.value() * self.MHz_to_Hz)
+
+    def send_amp(self):
+        self.dds_parameters.set_amplitude(self.amp_box.value())
 
     def on_widget_switch_changed(self, checked):
         self.dds_parameters.set_state(checked)
         self.set_switch_button_text(checked)
 
     def on_monitor_freq_changed(self, val):
-        self.freq_box.blockSignals(True)
-        self.freq_box.setValue(val / self.MHz_to_Hz)
-        self.freq_box.blockSignals(False)
+        blocker = QtCore.QSignalBlocker(self.freq_box)
+        self.freq_box.setValue(val * self.Hz_to_MHz)
+        blocker.unblock()
         self.dds_parameters.set_frequency(val, False)
 
     def on_monitor_amp_changed(self, val):
-        self.amp_box.blockSignals(True)
+        blocker = QtCore.QSignalBlocker(self.amp_box)
         self.amp_box.setValue(val)
-        self.amp_box.blockSignals(False)
+        blocker.unblock()
         self.dds_parameters.set_amplitude(val, False)
 
     def on_monitor_att_changed(self, val):
         self.dds_parameters.set_att(val, False)
 
     def on_monitor_switch_changed(self, checked):
-        self.switch_button.blockSignals(True)
+        blocker = QtCore.QSignalBlocker(self.switch_button)
         self.switch_button.setChecked(checked)
-        self.switch_button.blockSignals(False)
+        blocker.unblock()
         self.set_switch_button_text(checked)
         self.dds_parameters.set_state(checked, False)
 
@@ -235,12 +325,22 @@ class DDSChannel(QtWidgets.QGroupBox):
             self.switch_button.setText("o")
 
     def contextMenuEvent(self, event):
-        menu = QtWidgets.QMenu()
-        details_action = menu.addAction("Details")
-        action = menu.exec_(self.mapToGlobal(event.pos()))
-        if action == details_action:
-            self.show_details()
+        self.context_menu.popup(self.mapToGlobal(event.pos()))
 
     def show_details(self):
-        self.details = DDSDetail(self.dds_parameters, self)
-        self.details.exec_()
+        """Shows the details dialog without blocking other channels.
+
+        If the dialog is already open, it is brought to the front.
+        """
+        if self.details is None:
+            self.details = DDSDetail(self.dds_parameters, self)
+            self.details.setWindowModality(QtCore.Qt.NonModal)
+            self.details.finished.connect(self._details_closed)
+            self.details.show()
+        else:
+            self.details.raise_()
+            self.details.activateWindow()
+
+    def _details_closed(self, result):
+        # the dialog is deleted on close.
+        self.details = None
@@ -1,19 +1,25 @@
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import importlib.util
 import logging
 import os
 import pickle
 
-from artiq.applets.simple import SimpleApplet
 from artiq.dashboard import explorer
 from artiq.gui.models import ModelSubscriber
-from artiq.master.worker_impl import (ExamineDatasetMgr, ExamineDeviceMgr,
-                                      TraceArgumentManager)
 from jax import JaxApplet
 from jax.util.ui.dialog_on_top import DialogOnTop
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
+@functools.lru_cache(maxsize=1)
+def _ok_icon():
+    """Returns the icon of submit buttons. It can only be called after QApplication is created."""
+    return QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_DialogOkButton)
+
+
 class StatusUpdater:
     """Stores and updates the status of the experiment explorer.
 
@@ -36,15 +42,32 @@ class StatusUpdater:
 
 
 class ExperimentDetails(DialogOnTop):
-    """A dialog showing details of an experiment."""
+    """A dialog showing details of an experiment.
+
+    The dialog is reused. Call load() to show the details of an experiment.
+    """
 
-    def __init__(self, expurl, parent):
+    def __init__(self, parent):
         super().__init__(parent)
-        self.expurl = expurl
-        self._expinfo = self.parent()._resolve_expurl(expurl)
-        self.setWindowTitle(self._expinfo["class_name"])
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
+        self.expurl = None
         self.initialize_gui()
 
+    def load(self, expurl):
+        """Resets the fields to the defaults of an experiment.
+
+        Args:
+            expurl: str, experiment URL.
+        """
+        self.expurl = expurl
+        expinfo = self.parent()._resolve_expurl(expurl)
+        self.setWindowTitle(expinfo["class_name"])
+        scheduler_defaults = expinfo["scheduler_defaults"]
+        self.spinbox_priority.setValue(scheduler_defaults.get("priority", 0))
+        self.textbox_pipeline.setText(scheduler_defaults.get("pipeline_name", "main"))
+        self.combobox_log_level.setCurrentIndex(1)
+        self.checkbox_preload.setChecked(True)
+
     def initialize_gui(self):
         grid = QtWidgets.QGridLayout()
         self.setLayout(grid)
@@ -58,8 +81,6 @@ class ExperimentDetails(DialogOnTop):
         self.spinbox_priority = QtWidgets.QSpinBox()
         self.spinbox_priority.setMinimum(-100)
         self.spinbox_priority.setMaximum(100)
-        default_priority = self._expinfo["scheduler_defaults"].get("priority", 0)
-        self.spinbox_priority.setValue(default_priority)
         grid.addWidget(self.spinbox_priority, 0, 1)
 
         label_pipeline = QtWidgets.QLabel("Pipeline")
@@ -69,10 +90,6 @@ class ExperimentDetails(DialogOnTop):
         grid.addWidget(label_pipeline, 1, 0)
 
         self.textbox_pipeline = QtWidgets.QLineEdit()
-        default_pipeline = self._expinfo["scheduler_defaults"].get(
-            "pipeline_name", "main"
-        )
-        self.textbox_pipeline.setText(default_pipeline)
         grid.addWidget(self.textbox_pipeline, 1, 1)
 
         label_log_level = QtWidgets.QLabel("Log level")
@@ -85,22 +102,16 @@ class ExperimentDetails(DialogOnTop):
         self.combobox_log_level.addItems(
             ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         )
-        self.combobox_log_level.setCurrentIndex(1)
         grid.addWidget(self.combobox_log_level, 2, 1)
 
         self.checkbox_preload = QtWidgets.QCheckBox("Preload parameters when scheduled")
-        self.checkbox_preload.setChecked(True)
         self.checkbox_preload.setToolTip(
             "Uses the parameters when the experiment is scheduled."
         )
         grid.addWidget(self.checkbox_preload, 3, 0, 1, 2)
 
         submit = QtWidgets.QPushButton("Submit")
-        submit.setIcon(
-            QtWidgets.QApplication.style().standardIcon(
-                QtWidgets.QStyle.SP_DialogOkButton
-            )
-        )
+        submit.setIcon(_ok_icon())
         submit.clicked.connect(self.submit_clicked)
         submit.setToolTip("Schedule the selected experiment")
         grid.addWidget(submit, 4, 0, 1, 2)
@@ -129,6 +140,8 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
     # subscribe to this method to update when an experiment is selected / deselected.
     # TODO: add a blank experiment to show all parameters.
     parameters_updated = QtCore.pyqtSignal(object)
+    # signal emitted when parameters of all experiments are loaded in the background.
+    all_parameters_loaded = QtCore.pyqtSignal(object)
 
     def __init__(self, args, **kwds):
         super().__init__(**kwds)
@@ -137,6 +150,16 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
         self.initialize_gui()
 
         self._disconnect_reported = False
+        self._device_db_hash = None
+        self._details = None
+        self._module_cache = {}  # {path: (mtime, module)}
+        self._parameter_paths_cache = {}  # {(path, class_name): (mtime, parameter_paths)}
+        # {(path, class_name): (mtime, exception)} of experiments that failed to build.
+        self._failed_loads = {}
+        self._reported_failures = set()  # {(file, class_name)} of reported load failures.
+        # builds experiments one at a time outside of the GUI thread.
+        self._experiment_loader = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.all_parameters_loaded.connect(self._all_parameters_loaded)
         asyncio.get_event_loop().run_until_complete(
             self.connect_subscribers()  # run in the main thread asyncio loop.
         )
@@ -154,15 +177,13 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
 
         self.explorer = QtWidgets.QTreeView()
         self.explorer.setHeaderHidden(True)
+        # all rows are single line text, so row heights do not need to be measured.
+        self.explorer.setUniformRowHeights(True)
         self.explorer.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectItems)
         self.stack.addWidget(self.explorer)
 
         submit = QtWidgets.QPushButton("Submit")
-        submit.setIcon(
-            QtWidgets.QApplication.style().standardIcon(
-                QtWidgets.QStyle.SP_DialogOkButton
-            )
-        )
+        submit.setIcon(_ok_icon())
         submit.setToolTip("Schedule the selected experiment")
         layout.addWidget(submit, 1, 0)
         submit.clicked.connect(self.submit)
@@ -175,6 +196,12 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
         self.repo_path = None
         self._parameters_initialized = True
         self._experiment_parameters = {}
+        self._last_emitted_parameters = None  # (expurl, parameters) last emitted.
+        # selection changes within the interval only emit parameters_updated once.
+        self._selection_timer = QtCore.QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(30)
+        self._selection_timer.timeout.connect(self._emit_parameters_updated)
         widget.setLayout(layout)
         self.setWidget(widget)
 
@@ -208,11 +235,13 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
         self._explist_sub = ModelSubscriber(
             "explist", explorer.Model, self._report_disconnect
         )
-        await self._explist_sub.connect(localhost, port_notify)
         self._explist_status_sub = ModelSubscriber(
             "explist_status", StatusUpdater, self._report_disconnect
         )
-        await self._explist_status_sub.connect(localhost, port_notify)
+        await asyncio.gather(
+            self._explist_sub.connect(localhost, port_notify),
+            self._explist_status_sub.connect(localhost, port_notify),
+        )
 
         self.explist_model = explorer.Model(dict())
         self.explorer.setModel(self.explist_model)
@@ -246,11 +275,10 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
 
     async def artiq_connected(self):
         self.artiq = self.cxn.get_server("artiq")
-        device_db = await self.artiq.get_device_db()
-        self.device_db = pickle.loads(device_db)
-        # patch the `ExamineDeviceMgr.get_device_db` method.
-        ExamineDeviceMgr.get_device_db = lambda: self.device_db
-        self.repo_path = await self.artiq.get_repository_path()
+        device_db, self.repo_path = await asyncio.gather(
+            self.artiq.get_device_db(), self.artiq.get_repository_path()
+        )
+        await self._update_device_db(device_db)
 
         if not self._parameters_initialized:
             self._get_all_experiment_parameters()
@@ -263,29 +291,56 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
         self.setDisabled(True)
 
     def scan_repository(self):
-        async def worker():
-            await self.artiq.scan_experiment_repository(False)
+        self.run_in_labrad_loop(self._scan_repository)()
 
-        self.run_in_labrad_loop(worker)()
+    async def _scan_repository(self):
+        await self.artiq.scan_experiment_repository(False)
 
     def scan_devices(self):
-        async def worker():
-            await self.artiq.scan_device_db()
-            device_db = await self.artiq.get_device_db()
-            self.device_db = pickle.loads(device_db)
-            ExamineDeviceMgr.get_device_db = lambda: self.device_db
+        self.run_in_labrad_loop(self._scan_devices)()
+
+    async def _scan_devices(self):
+        await self.artiq.scan_device_db()
+        await self._update_device_db(await self.artiq.get_device_db())
 
-        self.run_in_labrad_loop(worker)()
+    async def _update_device_db(self, device_db):
+        """Loads the pickled device_db if it is different from the loaded one.
+
+        It is unpickled in another thread to keep the labrad event loop responsive.
+
+        Args:
+            device_db: bytes, pickled device_db from the artiq server.
+        """
+        device_db_hash = hashlib.blake2b(device_db, digest_size=16).digest()
+        if device_db_hash == self._device_db_hash:
+            return
+        self.device_db = await asyncio.get_event_loop().run_in_executor(
+            None, pickle.loads, device_db
+        )
+        self._device_db_hash = device_db_hash
+        # experiments may fail to build due to missing devices, so they are retried.
+        self._failed_loads.clear()
+
+    def _get_device_db(self):
+        return self.device_db
 
     def set_model(self, model):
         """Called when the experiment list subscriber receives an update."""
         self.explist_model = model
-        self.explorer.setModel(model)
+        # repaints once after the model is replaced.
+        self.explorer.setUpdatesEnabled(False)
+        try:
+            self.explorer.setModel(model)
+        finally:
+            self.explorer.setUpdatesEnabled(True)
+        # setModel creates a new selection model.
+        self.explorer.selectionModel().selectionChanged.connect(self.selection_changed)
 
     def _get_selected_expurl(self):
-        selection = self.explorer.selectedIndexes()
-        if selection:
-            return self.explist_model.index_to_key(selection[0])
+        selection_model = self.explorer.selectionModel()
+        index = selection_model.currentIndex()
+        if index.isValid() and selection_model.isSelected(index):
+            return self.explist_model.index_to_key(index)
         else:
             return None
 
@@ -295,8 +350,12 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
 
     def show_details(self):
         expurl = self._get_selected_expurl()
-        details = ExperimentDetails(expurl, self)
-        details.exec_()
+        if expurl is None:
+            return
+        if self._details is None:
+            self._details = ExperimentDetails(self)
+        self._details.load(expurl)
+        self._details.exec_()
 
     async def _submit_experiment(
         self,
@@ -306,13 +365,14 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
         pipeline=None,
         log_level=None,
     ):
-        expinfo = self._resolve_expurl(expurl)
+        expinfo = self.explist_model.backing_store[expurl]
         filename = expinfo["file"]
         class_name = expinfo["class_name"]
+        scheduler_defaults = expinfo["scheduler_defaults"]
         if priority is None:
-            priority = expinfo["scheduler_defaults"].get("priority", 0)
+            priority = scheduler_defaults.get("priority", 0)
         if pipeline is None:
-            pipeline = expinfo["scheduler_defaults"].get("pipeline_name", "main")
+            pipeline = scheduler_defaults.get("pipeline_name", "main")
         if log_level is None:
             log_level = 20
 
@@ -320,7 +380,10 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
             # If the experiment is changed after last repository scan, the parameters
             # may have been changed and the cache saved in `self._experiment_parameters`
             # should not be used.
-            required_params = self._get_experiment_parameters(filename, class_name)
+            # imports the experiment in another thread to keep the labrad event loop responsive.
+            required_params = await asyncio.get_event_loop().run_in_executor(
+                self._experiment_loader, self._get_experiment_parameters, filename, class_name
+            )
         else:
             required_params = []
         parameter_override_list = []  # TODO: implement parameter scanning / overriding.
@@ -365,6 +428,8 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
             self.stack.setCurrentWidget(self.waiting_panel)
             self.waiting_panel.start()
         else:
+            # experiments that failed to build are retried, as the modules they import may be fixed.
+            self._failed_loads.clear()
             if self.repo_path is not None:
                 self._get_all_experiment_parameters()
             else:
@@ -374,31 +439,70 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
             self.waiting_panel.stop()
 
     def selection_changed(self, selected, deselected):
-        """Triggers the parameter_updated signal."""
+        """Triggers the parameter_updated signal after a short delay."""
+        self._selection_timer.start()
+
+    def _emit_parameters_updated(self):
         expurl = self._get_selected_expurl()
-        if expurl is None and expurl in self._experiment_parameters:
-            self.parameters_updated.emit(self._experiment_parameters[expurl])
+        if expurl is not None and expurl in self._experiment_parameters:
+            parameters = self._experiment_parameters[expurl]
         else:
-            self.parameters_updated.emit([])
+            parameters = []
+        # does not emit again if neither the selection nor its parameters are changed.
+        if self._last_emitted_parameters is not None:
+            last_expurl, last_parameters = self._last_emitted_parameters
+            if expurl == last_expurl and parameters == last_parameters:
+                return
+        self._last_emitted_parameters = (expurl, parameters)
+        self.parameters_updated.emit(parameters)
 
     def _get_all_experiment_parameters(self):
-        self._experiment_parameters = {}
+        """Loads the parameters of all experiments in a background thread.
+
+        self._experiment_parameters is updated when all_parameters_loaded is emitted.
+        """
+        experiments = {}
         for expurl in self.explist_model.backing_store:
             expinfo = self._resolve_expurl(expurl)
-            filename = expinfo["file"]
-            class_name = expinfo["class_name"]
+            experiments[expurl] = (expinfo["file"], expinfo["class_name"])
+        self.run_in_labrad_loop(self._load_all_experiment_parameters)(experiments)
+
+    async def _load_all_experiment_parameters(self, experiments):
+        experiment_parameters = await asyncio.get_event_loop().run_in_executor(
+            self._experiment_loader, self._get_experiment_parameters_of, experiments
+        )
+        self.all_parameters_loaded.emit(experiment_parameters)
+
+    def _get_experiment_parameters_of(self, experiments):
+        experiment_parameters = {}
+        for expurl, (filename, class_name) in experiments.items():
             try:
-                self._experiment_parameters[expurl] = self._get_experiment_parameters(
+                experiment_parameters[expurl] = self._get_experiment_parameters(
                     filename, class_name
                 )
+                self._reported_failures.discard((filename, class_name))
             except Exception:
-                print(f"Cannot load the parameters in {class_name} of {filename}.")
+                # each broken experiment is reported once until it loads successfully.
+                if (filename, class_name) not in self._reported_failures:
+                    self._reported_failures.add((filename, class_name))
+                    logging.warning(
+                        f"Cannot load the parameters in {class_name} of {filename}.",
+                        exc_info=True,
+                    )
+        return experiment_parameters
+
+    @QtCore.pyqtSlot(object)
+    def _all_parameters_loaded(self, experiment_parameters):
+        self._experiment_parameters = experiment_parameters
+        self.selection_changed(None, None)
 
     def _get_experiment_parameters(self, filename, class_name):
         """Creates the experiment class and tries to get the required parameters of the experiment.
 
         It imports the experiment module, builds the class, and tries to read the `parameter_paths`
-        attribute of the experiment.
+        attribute of the experiment. Modules and parameters are cached until the experiment file
+        is modified. Experiments that failed to build are not retried until the file or the
+        device_db is modified, or the repository is scanned.
 
         Args:
             filename: str, file path from the repository root.
@@ -408,36 +512,70 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
             list of 2-tuples of strs, list of required parameters in
             (collection_name, parameter_name). If the experiment does not have required parmeters,
             it returns an empty list.
+
+        Raises:
+            RuntimeError: if the experiment failed to build and is not modified since.
+                It is chained from the original exception.
         """
-        module_name = os.path.basename(filename).split(".")[0]
+        module_name = os.path.splitext(os.path.basename(filename))[0]
         filename = os.path.join(self.repo_path, filename)
-        spec = importlib.util.spec_from_file_location(module_name, filename)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        cls = getattr(module, class_name)
-        exp = cls((ExamineDeviceMgr, ExamineDatasetMgr, TraceArgumentManager(), {}))
+        mtime = os.path.getmtime(filename)
+        key = (filename, class_name)
+        cached = self._parameter_paths_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        failed = self._failed_loads.get(key)
+        if failed is not None and failed[0] == mtime:
+            raise RuntimeError(f"{class_name} in {filename} failed to build.") from failed[1]
+
+        # worker_impl imports much of artiq, so it is only imported when an experiment is built.
+        from artiq.master.worker_impl import (ExamineDatasetMgr, ExamineDeviceMgr,
+                                              TraceArgumentManager)
+        if ExamineDeviceMgr.get_device_db != self._get_device_db:
+            # patch the `ExamineDeviceMgr.get_device_db` method once.
+            # it returns self.device_db, so it does not need to be patched when it is updated.
+            ExamineDeviceMgr.get_device_db = self._get_device_db
+
+        try:
+            module = self._load_module(module_name, filename, mtime)
+            cls = getattr(module, class_name)
+            exp = cls((ExamineDeviceMgr, ExamineDatasetMgr, TraceArgumentManager(), {}))
+        except Exception as e:
+            self._failed_loads[key] = (mtime, e)
+            raise
         try:
             parameter_paths = exp.parameter_paths
         except AttributeError as e:
             parameter_paths = []  # allows experiments without parameter_paths to run.
+        self._parameter_paths_cache[key] = (mtime, parameter_paths)
         return parameter_paths
 
+    def _load_module(self, module_name, filename, mtime):
+        """Imports an experiment file, reusing the module if the file is not modified."""
+        cached = self._module_cache.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        spec = importlib.util.spec_from_file_location(module_name, filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self._module_cache[filename] = (mtime, module)
+        return module
+
     def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
         """Closes subscribers when the applet is closed."""
-
-        async def close_subscribers():
-            try:
-                await self._explist_sub.close()
-            except Exception as e:
-                pass
-            try:
-                await self._explist_status_sub.close()
-            except Exception as e:
-                pass
-
-        asyncio.run_coroutine_threadsafe(close_subscribers(), asyncio.get_event_loop())
+        # the main thread event loop is running, so the coroutine cannot be waited for here.
+        asyncio.run_coroutine_threadsafe(self._close_subscribers(), asyncio.get_event_loop())
+        self._experiment_loader.shutdown(wait=False)
         return super().closeEvent(a0)
 
+    async def _close_subscribers(self):
+        # errors are ignored as the subscribers may be already disconnected.
+        await asyncio.gather(
+            self._explist_sub.close(),
+            self._explist_status_sub.close(),
+            return_exceptions=True,
+        )
+
     def save_state(self):
         return {}
 
@@ -446,6 +584,8 @@ class Explorer(QtWidgets.QDockWidget, JaxApplet):
 
 
 def main():
+    from artiq.applets.simple import SimpleApplet
+
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
     applet = SimpleApplet(Explorer)
     applet.run()
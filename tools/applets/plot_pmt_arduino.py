@@ -28,21 +28,17 @@ class PlotPMTArduino(RealTimePlotApplet):
         if dataset_name == "pmt_arduino.times":
             self._times = value
         elif dataset_name == "pmt_arduino.counts_kHz":
-            value = _np.transpose(value)
-            for kk in range(len(value)):
-                self.traces[kk].set(self._times, value[kk])
+            for trace, counts in zip(self.traces, value.T):
+                trace.set(self._times, counts)
 
     def _append(self, dataset_name, value):
         if dataset_name == "pmt_arduino.times":
             for kk in range(len(self.traces)):
                 self.traces[kk].append_x(value)
         elif dataset_name == "pmt_arduino.counts_kHz":
-            value = _np.transpose(value)
-            for kk in range(len(self.traces)):
-                self.traces[kk].append_y(value[kk])
-                self.traces[
-                    kk
-                ].update_trace()  # only update the plot when counts are updated.
+            for trace, counts in zip(self.traces, value.T):
+                trace.append_y(counts)
+                trace.update_trace()  # only update the plot when counts are updated.
 
 
 def main():
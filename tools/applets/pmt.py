@@ -4,6 +4,11 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 
 class PMT(QtWidgets.QWidget, JaxApplet):
+    do_update_counts = QtCore.pyqtSignal(object)
+    # the counts display is updated at most once in this interval, as it is not readable if
+    # updated faster.
+    DISPLAY_INTERVAL_MS = 100
+
     def __init__(self, args, **kwds):
         super().__init__(**kwds)
         self._dv_on = False
@@ -13,6 +18,12 @@ class PMT(QtWidgets.QWidget, JaxApplet):
         self._normal_mode_text = "Normal"
         self._differential_mode_text = "Differential"
         self._pmt_counts_dataset = "pmt.counts_kHz"
+        self._pending_counts = None
+        self._display_timer = QtCore.QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(self.DISPLAY_INTERVAL_MS)
+        self._display_timer.timeout.connect(self._display_counts)
+        self.do_update_counts.connect(self._queue_counts)
 
         self.initialize_gui()
         # connects to LabRAD in a different thread, and calls self.labrad_connected when finished.
@@ -25,7 +36,10 @@ class PMT(QtWidgets.QWidget, JaxApplet):
             self.setDisabled(True)
 
     def initialize_gui(self):
-        shell_font = "MS Shell Dlg 2"
+        font = QtGui.QFont("MS Shell Dlg 2", pointSize=12)
+        size_policy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
+        )
 
         layout = QtWidgets.QGridLayout()
         self.number = QtWidgets.QLCDNumber()
@@ -35,44 +49,34 @@ class PMT(QtWidgets.QWidget, JaxApplet):
 
         mode_label = QtWidgets.QLabel("Mode:")
         mode_label.setAlignment(QtCore.Qt.AlignBottom)
-        mode_label.setFont(QtGui.QFont(shell_font, pointSize=12))
-        mode_label.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
-        )
+        mode_label.setFont(font)
+        mode_label.setSizePolicy(size_policy)
         layout.addWidget(mode_label, 1, 0)
 
         self.mode_combobox = QtWidgets.QComboBox()
         self.mode_combobox.addItem(self._normal_mode_text)
         self.mode_combobox.addItem(self._differential_mode_text)
-        self.mode_combobox.setFont(QtGui.QFont(shell_font, pointSize=12))
-        self.mode_combobox.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
-        )
+        self.mode_combobox.setFont(font)
+        self.mode_combobox.setSizePolicy(size_policy)
         layout.addWidget(self.mode_combobox, 2, 0)
 
         interval_label = QtWidgets.QLabel("Interval:")
         interval_label.setAlignment(QtCore.Qt.AlignBottom)
-        interval_label.setFont(QtGui.QFont(shell_font, pointSize=12))
-        interval_label.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
-        )
+        interval_label.setFont(font)
+        interval_label.setSizePolicy(size_policy)
         layout.addWidget(interval_label, 3, 0)
 
         self.interval_spinbox = QtWidgets.QDoubleSpinBox()
         self.interval_spinbox.setSuffix(" s")
         self.interval_spinbox.setSingleStep(0.1)
         self.interval_spinbox.setDecimals(2)
-        self.interval_spinbox.setFont(QtGui.QFont(shell_font, pointSize=12))
-        self.interval_spinbox.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
-        )
+        self.interval_spinbox.setFont(font)
+        self.interval_spinbox.setSizePolicy(size_policy)
         layout.addWidget(self.interval_spinbox, 4, 0)
 
         self.start_button = QtWidgets.QPushButton("Start")
-        self.start_button.setFont(QtGui.QFont(shell_font, pointSize=12))
-        self.start_button.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum
-        )
+        self.start_button.setFont(font)
+        self.start_button.setSizePolicy(size_policy)
         self.start_button.setCheckable(True)
         layout.addWidget(self.start_button, 5, 0)
         self.setLayout(layout)
@@ -140,9 +144,16 @@ class PMT(QtWidgets.QWidget, JaxApplet):
 
     def setup_gui_listeners(self):
         self.number.overflow.connect(self.number_overflow)
-        self.start_button.toggled.connect(self.start_button_toggled)
-        self.mode_combobox.currentTextChanged.connect(self.mode_combobox_text_changed)
-        self.interval_spinbox.valueChanged.connect(self.interval_spinbox_value_changed)
+        # wraps the slots once rather than on every signal emission.
+        self.start_button.toggled.connect(
+            self.run_in_labrad_loop(self.start_button_toggled)
+        )
+        self.mode_combobox.currentTextChanged.connect(
+            self.run_in_labrad_loop(self.mode_combobox_text_changed)
+        )
+        self.interval_spinbox.valueChanged.connect(
+            self.run_in_labrad_loop(self.interval_spinbox_value_changed)
+        )
 
     def pmt_disconnected(self):
         self._pmt_on = False
@@ -154,7 +165,17 @@ class PMT(QtWidgets.QWidget, JaxApplet):
 
     def _data_change(self, signal, value):
         if value[1] == self._pmt_counts_dataset:
-            self._set_number(value[2][0][0])
+            self.do_update_counts.emit(value[2][0][0])
+
+    @QtCore.pyqtSlot(object)
+    def _queue_counts(self, counts):
+        """Stores the latest counts until the next display update."""
+        self._pending_counts = counts
+        if not self._display_timer.isActive():
+            self._display_timer.start()
+
+    def _display_counts(self):
+        self._set_number(self._pending_counts)
 
     def _new_pmt_mode(self, signal, value):
         self._set_pmt_mode(value)
@@ -199,27 +220,18 @@ class PMT(QtWidgets.QWidget, JaxApplet):
     def number_overflow(self):
         self.number.display("OUFL")
 
-    def start_button_toggled(self, checked):
-        async def _start_button_toggled(self, checked):
-            self._set_pmt_state(checked)
-            if checked:
-                await self.pmt.start()
-            else:
-                await self.pmt.stop()
-
-        self.run_in_labrad_loop(_start_button_toggled)(self, checked)
-
-    def mode_combobox_text_changed(self, text):
-        async def _mode_combobox_text_changed(self, text):
-            await self.pmt.set_mode(text == self._differential_mode_text)
-
-        self.run_in_labrad_loop(_mode_combobox_text_changed)(self, text)
+    async def start_button_toggled(self, checked):
+        self._set_pmt_state(checked)
+        if checked:
+            await self.pmt.start()
+        else:
+            await self.pmt.stop()
 
-    def interval_spinbox_value_changed(self, value):
-        async def _interval_spinbox_value_changed(self, value):
-            await self.pmt.set_interval(value)
+    async def mode_combobox_text_changed(self, text):
+        await self.pmt.set_mode(text == self._differential_mode_text)
 
-        self.run_in_labrad_loop(_interval_spinbox_value_changed)(self, value)
+    async def interval_spinbox_value_changed(self, value):
+        await self.pmt.set_interval(value)
 
 
 def main():
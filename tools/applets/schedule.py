@@ -26,11 +26,14 @@ class Schedule(QtWidgets.QDockWidget, JaxApplet):
         self.setDisabled(True)
 
         self._disconnect_reported = False
-        asyncio.get_event_loop().run_until_complete(
-            self.connect_subscribers()  # run in the main thread asyncio loop.
+        self._schedule_sub = ModelSubscriber(
+            "schedule", schedule.Model, self._report_disconnect
         )
 
         self.initialize_gui()
+        # runs once the main thread asyncio loop starts.
+        connect_task = asyncio.ensure_future(self.connect_subscribers())
+        connect_task.add_done_callback(self._subscribers_connected)
         self.connect_to_labrad("::1")  # only works on localhost.
 
     def initialize_gui(self):
@@ -51,14 +54,8 @@ class Schedule(QtWidgets.QDockWidget, JaxApplet):
 
         cw = QtGui.QFontMetrics(self.font()).averageCharWidth()
         h = self.table.horizontalHeader()
-        h.resizeSection(0, 7 * cw)
-        h.resizeSection(1, 12 * cw)
-        h.resizeSection(2, 16 * cw)
-        h.resizeSection(3, 6 * cw)
-        h.resizeSection(4, 16 * cw)
-        h.resizeSection(5, 30 * cw)
-        h.resizeSection(6, 20 * cw)
-        h.resizeSection(7, 20 * cw)
+        for section, width in enumerate((7, 12, 16, 6, 16, 30, 20, 20)):
+            h.resizeSection(section, width * cw)
 
     def _create_context_menu(self):
         self.table.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
@@ -93,13 +90,14 @@ class Schedule(QtWidgets.QDockWidget, JaxApplet):
     async def connect_subscribers(self):
         localhost = "::1"
         port_notify = 3250
-        self._schedule_sub = ModelSubscriber(
-            "schedule", schedule.Model, self._report_disconnect
-        )
         await self._schedule_sub.connect(localhost, port_notify)
 
+    def _subscribers_connected(self, task):
+        if task.cancelled() or task.exception() is not None:
+            self._report_disconnect()
+
     def _report_disconnect(self):
-        if not self._disconnected_reported:
+        if not self._disconnect_reported:
             print("connection to master lost, restart dashboard to reconnect")
             self.setDisabled(True)
         self._disconnect_reported = True
@@ -147,16 +145,16 @@ class Schedule(QtWidgets.QDockWidget, JaxApplet):
             self.run_in_labrad_loop(self.delete)(rid, graceful)
 
     async def request_term_multiple(self, rids):
-        """Terminates multiple experiments."""
-        for rid in rids:
-            try:
-                await self.artiq.request_terminate_experiment(rid)
-            except Exception as e:
-                # May happen if the experiment has terminated by itself
-                # while we were terminating others.
-                print(
-                    "failed to request termination of RID {rid}"
-                )
+        """Terminates multiple experiments concurrently."""
+        await asyncio.gather(*(self._request_termination(rid) for rid in rids))
+
+    async def _request_termination(self, rid):
+        try:
+            await self.artiq.request_terminate_experiment(rid)
+        except Exception:
+            # May happen if the experiment has terminated by itself
+            # while we were terminating others.
+            print(f"failed to request termination of RID {rid}")
 
     def terminate_pipeline_clicked(self):
         idx = self.table.selectedIndexes()
@@ -164,14 +162,13 @@ class Schedule(QtWidgets.QDockWidget, JaxApplet):
             row = idx[0].row()
             selected_rid = self.table_model.row_to_key[row]
             pipeline = self.table_model.backing_store[selected_rid]["pipeline"]
-            print(
-                "Requesting termination of all " "experiments in pipeline '{pipeline}'"
-            )
-
-            rids = set()
-            for rid, info in self.table_model.backing_store.items():
-                if info["pipeline"] == pipeline:
-                    rids.add(rid)
+            print(f"Requesting termination of all experiments in pipeline '{pipeline}'")
+
+            rids = {
+                rid
+                for rid, info in self.table_model.backing_store.items()
+                if info["pipeline"] == pipeline
+            }
             self.run_in_labrad_loop(self.request_term_multiple)(rids)
 
     def run_initialization(self):
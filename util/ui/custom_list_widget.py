@@ -23,6 +23,8 @@ class CustomListWidget(QtWidgets.QListWidget):
         self.setFlow(QtWidgets.QListView.LeftToRight)
         self.setResizeMode(QtWidgets.QListView.Adjust)
         self.setViewMode(QtWidgets.QListView.IconMode)
+        # all items are laid out on the same grid size.
+        self.setUniformItemSizes(True)
 
     def add_item_and_widget(self, name, widget, visible=True, sort_index=None, padding=10):
         """Adds an widget to the ListWidget.
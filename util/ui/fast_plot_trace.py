@@ -23,6 +23,31 @@ class _PlotPath(_pg.QtWidgets.QGraphicsPathItem):
         return self.path.boundingRect()
 
 
+def _append_to_buffer(buffer, length, data):
+    """Appends data after the first length elements of buffer.
+
+    The buffer capacity is at least doubled when it is full, so appending n elements costs
+    amortized O(n) instead of copying all existing data on every append.
+
+    Args:
+        buffer: np.array, data buffer. Only buffer[:length] is valid data.
+        length: int, number of valid elements in the buffer.
+        data: array-like, data to append.
+
+    Returns:
+        (buffer, length), buffer may be a new array if the old buffer is too short.
+    """
+    data = _np.asarray(data)
+    new_length = length + len(data)
+    dtype = _np.result_type(buffer, data)
+    if new_length > len(buffer) or dtype != buffer.dtype:
+        new_buffer = _np.empty((max(new_length, 2 * len(buffer)),) + buffer.shape[1:], dtype)
+        new_buffer[:length] = buffer[:length]
+        buffer = new_buffer
+    buffer[length:new_length] = data
+    return buffer, new_length
+
+
 class FastPlotTrace(QtCore.QObject):
     """An interface to plot a trace efficiently.
 
@@ -51,8 +76,11 @@ class FastPlotTrace(QtCore.QObject):
         self._length_to_path = length_to_path
         self._plot_paths = []  # list of _PlotPath.
         self._plot_data_item = None  # actual PlotWidget.plot object.
+        # data buffers. only the first self._xlength and self._ylength elements are data.
         self._xdata = None
         self._ydata = None
+        self._xlength = 0
+        self._ylength = 0
 
     def update_trace(self, name=None):
         """Updates the trace on the plot."""
@@ -61,10 +89,10 @@ class FastPlotTrace(QtCore.QObject):
         # length of data to plot.
         # if xdata and ydata do not have the same length.
         # the longer one is not fully plotted.
-        len_plot = min([len(self._xdata), len(self._ydata)])
-        if len_plot == self._last_length:
+        len_plot = min(self._xlength, self._ylength)
+        if len_plot == self._last_length or self._xlength == 0:
             return
-        last_x = self._xdata[-1]  # x-coordinate of the last data point.
+        last_x = self._xdata[self._xlength - 1]  # x-coordinate of the last data point.
         while len_plot > self._length_to_path:
             # creates _PlotPath until the length is shorter than self._length_to_path.
             path = _PlotPath(self._xdata[:self._length_to_path],
@@ -72,17 +100,16 @@ class FastPlotTrace(QtCore.QObject):
                              self._pen)
             self._plot_widget.addItem(path)
             self._plot_paths.append(path)
-            self._xdata = self._xdata[self._length_to_path-1:]
-            self._ydata = self._ydata[self._length_to_path-1:]
-            len_plot = min([len(self._xdata), len(self._ydata)])
-        if len_plot == len(self._xdata):
-            xdata = self._xdata
-        else:
-            xdata = self._xdata[:len_plot]
-        if len_plot == len(self._ydata):
-            ydata = self._ydata
-        else:
-            ydata = self._ydata[:len_plot]
+            # moves the remaining data, starting from the last point in the path,
+            # to the beginning of the buffers.
+            shift = self._length_to_path - 1
+            self._xdata[:self._xlength - shift] = self._xdata[shift:self._xlength]
+            self._ydata[:self._ylength - shift] = self._ydata[shift:self._ylength]
+            self._xlength -= shift
+            self._ylength -= shift
+            len_plot = min(self._xlength, self._ylength)
+        xdata = self._xdata[:len_plot]
+        ydata = self._ydata[:len_plot]
         if self._plot_data_item is not None:
             self._plot_data_item.setData(xdata, ydata)
         else:
@@ -110,16 +137,18 @@ class FastPlotTrace(QtCore.QObject):
         """
         self._xdata = _np.array(xdata)
         self._ydata = _np.array(ydata)
+        self._xlength = len(self._xdata)
+        self._ylength = len(self._ydata)
         self.remove_trace()
         self.update_trace(name)
 
     def append_x(self, xdata):
         """Appends to the x-axis data."""
-        self._xdata = _np.append(self._xdata, _np.array(xdata), axis=0)
+        self._xdata, self._xlength = _append_to_buffer(self._xdata, self._xlength, xdata)
 
     def append_y(self, ydata):
         """Appends to the y-axis data."""
-        self._ydata = _np.append(self._ydata, _np.array(ydata), axis=0)
+        self._ydata, self._ylength = _append_to_buffer(self._ydata, self._ylength, ydata)
 
     def append(self, xdata, ydata):
         """Appends to both x-axis and y-axis data, and updates the trace."""